@@ -4,7 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
+from copy import deepcopy
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
+from itertools import islice
+from time import time
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
@@ -17,15 +26,29 @@ from .api import SolarGuardianAPI, SolarGuardianAPIError
 from .const import (
     CONF_APP_KEY,
     CONF_APP_SECRET,
+    CONF_MAX_CONCURRENT_REQUESTS,
     CONF_UPDATE_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
+    LATEST_DATA_BATCH_SIZE,
+    MAX_UPDATE_ERRORS,
+    MAX_UPDATE_INTERVAL,
+    METADATA_REFRESH_INTERVAL,
+    MIN_UPDATE_INTERVAL,
+    MOCK_DEVICE,
+    MOCK_POWER_STATION,
+    MOCK_SENSOR_COUNT,
+    MOCK_VARIABLE_GROUPS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
 
+# Update interval used while the API keeps failing
+BACKOFF_INTERVAL = timedelta(minutes=5)
+
 # Service schemas
 SERVICE_TEST_CONNECTION = "test_connection"
 SERVICE_GET_DIAGNOSTICS = "get_diagnostics"
@@ -37,16 +60,212 @@ SERVICE_TEST_CONNECTION_SCHEMA = vol.Schema(
     }
 )
 
+# Static part of the mock payload used when the API is unavailable. Deep-copied
+# for every refresh so nothing done to one cycle's data reaches the next, or the
+# MOCK_* constants it is built from.
+_MOCK_DATA_TEMPLATE: dict[str, Any] = {
+    "power_stations": {
+        "status": 0,
+        "data": {"list": [MOCK_POWER_STATION], "total": 1},
+    },
+    "devices": {
+        MOCK_POWER_STATION["id"]: {
+            "status": 0,
+            "data": {"list": [MOCK_DEVICE], "total": 1},
+        }
+    },
+    "device_data": {
+        MOCK_DEVICE["id"]: {
+            "status": 0,
+            "data": {"variableGroupList": MOCK_VARIABLE_GROUPS},
+        }
+    },
+    "status": "mock_mode",
+    "message": "Using mock data - API unavailable",
+    "update_summary": {
+        "stations": 1,
+        "devices": 1,
+        "sensors": MOCK_SENSOR_COUNT,
+        "errors": ["Using mock data due to API connectivity issues"],
+    },
+}
+
+# Fields of the device parameters response read by the sensor platform; the API
+# sends many more per variable and group, which are dropped after each fetch
+_GROUP_KEYS = frozenset({"variableGroupNameE", "variableGroupNameC"})
+_VARIABLE_KEYS = frozenset(
+    {
+        "dataIdentifier",
+        "dataPointId",
+        "deviceNo",
+        "variableName",
+        "variableNameE",
+        "variableNameC",
+        "unit",
+        "decimal",
+        "mode",
+        "translationChild",
+        "currentValue",
+        "value",
+        "defaultValue",
+    }
+)
+# Variable fields that repeat across devices; interned so they share one string
+_INTERNED_VARIABLE_KEYS = ("dataIdentifier", "deviceNo", "unit", "decimal", "mode")
+
+
+def _compact_device_parameters(device_data: dict) -> dict:
+    """Return device parameters reduced to the fields the sensors use."""
+    inner = device_data.get("data")
+    if not isinstance(inner, dict) or "variableGroupList" not in inner:
+        return device_data
+
+    groups = []
+    for group in inner["variableGroupList"]:
+        variables = []
+        for variable in group.get("variableList", ()):
+            compact = {
+                key: value for key, value in variable.items() if key in _VARIABLE_KEYS
+            }
+            for key in _INTERNED_VARIABLE_KEYS:
+                if type(value := compact.get(key)) is str:
+                    compact[key] = sys.intern(value)
+            variables.append(compact)
+        compact_group = {key: group[key] for key in _GROUP_KEYS if key in group}
+        compact_group["variableList"] = variables
+        groups.append(compact_group)
+
+    return {**device_data, "data": {**inner, "variableGroupList": groups}}
+
+
+class _DeviceParameters(NamedTuple):
+    """A device's compacted parameters and what each update needs from them."""
+
+    fetched_at: float
+    data: dict
+    param_count: int
+    # Latest data request entries ({"dataPointId", "deviceNo"}) of the device
+    datapoints: tuple[dict, ...]
+    # False if a readable variable has no datapoint, so its value can only
+    # come from the parameters themselves
+    covered: bool
+
+
+def _scan_device_parameters(device_data: dict, fetched_at: float) -> _DeviceParameters:
+    """Count a device's parameters and collect its latest data datapoints."""
+    param_count = 0
+    datapoints = []
+    covered = True
+    for group in device_data.get("data", {}).get("variableGroupList", ()):
+        variable_list = group.get("variableList", ())
+        param_count += len(variable_list)
+        for variable in variable_list:
+            data_point_id = variable.get("dataPointId")
+            device_no = variable.get("deviceNo")
+            if data_point_id and device_no:
+                datapoints.append({"dataPointId": data_point_id, "deviceNo": device_no})
+            elif variable.get("mode", "0") != "1":
+                covered = False
+    return _DeviceParameters(
+        fetched_at, device_data, param_count, tuple(datapoints), covered
+    )
+
+
+@lru_cache(maxsize=512)
+def _shared_device_info(
+    device_id: str, name: str, model: str, version: str | None
+) -> MappingProxyType[str, Any]:
+    """Return the read-only device info shared by all entities of a device."""
+    return MappingProxyType(
+        {
+            "identifiers": frozenset({(DOMAIN, device_id)}),
+            "name": name,
+            "manufacturer": "Epever",
+            "model": model,
+            "sw_version": version,
+        }
+    )
+
+
+def device_info(device: dict[str, Any]) -> dict[str, Any]:
+    """Return the device registry info for a device entry.
+
+    Built from the cached info of the device; every entity gets its own copy,
+    so changes to one entity's info never reach the others.
+    """
+    info = _shared_device_info(
+        str(device["id"]),
+        device["equipmentName"],
+        device.get("productName", "Solar Inverter"),
+        device.get("version"),
+    )
+    return {**info, "identifiers": set(info["identifiers"])}
+
+
+def _index_devices(data: dict) -> dict[Any, dict]:
+    """Index the devices of coordinator data by device id."""
+    return {
+        device["id"]: device
+        for devices in data.get("devices", {}).values()
+        for device in devices.get("data", {}).get("list", [])
+    }
+
+
+def _parse_latest_value(value: Any) -> Any:
+    """Return a latest data value as a float, or unchanged if it is not numeric."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return value
+
+
+def _index_latest_values(data: dict) -> dict[Any, dict[Any, Any]]:
+    """Index each device's parsed latest values by dataPointId (first one wins)."""
+    return {
+        device_id: {
+            point.get("dataPointId"): _parse_latest_value(point.get("value", 0))
+            for point in reversed(points)
+        }
+        for device_id, device_data in data.get("device_data", {}).items()
+        if (points := device_data.get("latest_data", {}).get("data", {}).get("list"))
+    }
+
+
+def _index_latest_identifiers(data: dict) -> dict[Any, frozenset]:
+    """Return the dataIdentifiers present in each device's latest data."""
+    return {
+        device_id: frozenset(point.get("dataIdentifier") for point in points)
+        for device_id, device_data in data.get("device_data", {}).items()
+        if (points := device_data.get("latest_data", {}).get("data", {}).get("list"))
+    }
+
+
+def _index_variables(data: dict) -> dict[Any, dict[str, dict]]:
+    """Index each device's parameter variables by dataIdentifier (first one wins)."""
+    return {
+        device_id: {
+            variable.get("dataIdentifier"): variable
+            for group in reversed(
+                device_data.get("data", {}).get("variableGroupList", [])
+            )
+            for variable in reversed(group.get("variableList", []))
+        }
+        for device_id, device_data in data.get("device_data", {}).items()
+    }
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up SolarGuardian from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
+    entry_data = entry.data
+    options = entry.options
+
     # Create API client
     api = SolarGuardianAPI(
-        domain=entry.data[CONF_DOMAIN],
-        app_key=entry.data[CONF_APP_KEY],
-        app_secret=entry.data[CONF_APP_SECRET],
+        domain=entry_data[CONF_DOMAIN],
+        app_key=entry_data[CONF_APP_KEY],
+        app_secret=entry_data[CONF_APP_SECRET],
     )
 
     # Test authentication
@@ -59,8 +278,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         return False
 
     # Create coordinator with custom update interval if specified
-    update_interval = entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
-    coordinator = SolarGuardianDataUpdateCoordinator(hass, api, update_interval)
+    update_interval = options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+    max_concurrent_requests = options.get(
+        CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+    )
+    coordinator = SolarGuardianDataUpdateCoordinator(
+        hass,
+        api,
+        update_interval,
+        max_concurrent_requests=max_concurrent_requests,
+    )
 
     # Fetch initial data
     try:
@@ -115,39 +342,43 @@ async def _test_connection_service(
     hass: HomeAssistant, entry_id: str, verbose: bool
 ) -> None:
     """Test API connection and log results."""
-    if entry_id not in hass.data[DOMAIN]:
+    if (entry_data := hass.data[DOMAIN].get(entry_id)) is None:
         _LOGGER.error("SolarGuardian integration not found")
         return
 
-    api: SolarGuardianAPI = hass.data[DOMAIN][entry_id]["api"]
+    api: SolarGuardianAPI = entry_data["api"]
 
-    _LOGGER.info("🚀 Starting SolarGuardian API connection test")
-    _LOGGER.info("🔧 Domain: %s", api.domain)
-    _LOGGER.info(
-        "🔧 App Key: %s...", api.app_key[:8] if len(api.app_key) > 8 else "***"
-    )
+    # Collected and logged as one message from the executor so the event loop
+    # doesn't take the logging lock once per line
+    report = [
+        "🚀 Starting SolarGuardian API connection test",
+        f"🔧 Domain: {api.domain}",
+        f"🔧 App Key: {api.app_key[:8] if len(api.app_key) > 8 else '***'}...",
+    ]
+    # Log message and arguments of a failure, logged after the report
+    failure: tuple[Any, ...] | None = None
 
     try:
         # Test authentication
-        _LOGGER.info("🔐 Testing authentication...")
+        report.append("🔐 Testing authentication...")
         auth_success = await api.authenticate()
         if auth_success:
-            _LOGGER.info("✅ Authentication successful")
+            report.append("✅ Authentication successful")
         else:
-            _LOGGER.error("❌ Authentication failed")
+            failure = ("❌ Authentication failed",)
             return
 
         # Test power stations
-        _LOGGER.info("🏭 Testing power stations endpoint...")
+        report.append("🏭 Testing power stations endpoint...")
         stations = await api.get_power_stations()
         stations_list = stations.get("data", {}).get("list", [])
-        _LOGGER.info("✅ Found %d power stations", len(stations_list))
+        report.append(f"✅ Found {len(stations_list)} power stations")
 
         if verbose and stations_list:
             for station in stations_list[:3]:  # Show first 3 stations
                 station_name = station.get("powerStationName", "Unknown")
                 station_id = station["id"]
-                _LOGGER.info("   📍 Station: %s (ID: %s)", station_name, station_id)
+                report.append(f"   📍 Station: {station_name} (ID: {station_id})")
 
         # Test devices for first station
         if stations_list:
@@ -155,10 +386,10 @@ async def _test_connection_service(
             station_id = station["id"]
             station_name = station.get("powerStationName", "Unknown")
 
-            _LOGGER.info("🔧 Testing devices endpoint for station: %s", station_name)
+            report.append(f"🔧 Testing devices endpoint for station: {station_name}")
             devices = await api.get_devices(station_id)
             devices_list = devices.get("data", {}).get("list", [])
-            _LOGGER.info("✅ Found %d devices", len(devices_list))
+            report.append(f"✅ Found {len(devices_list)} devices")
 
             if verbose and devices_list:
                 # Test device parameters for first device
@@ -166,88 +397,91 @@ async def _test_connection_service(
                 device_id = device["id"]
                 device_name = device.get("equipmentName", "Unknown")
 
-                _LOGGER.info("📊 Testing device parameters for: %s", device_name)
+                report.append(f"📊 Testing device parameters for: {device_name}")
                 device_data = await api.get_device_parameters(device_id)
                 variable_groups = device_data.get("data", {}).get(
                     "variableGroupList", []
                 )
-                _LOGGER.info("✅ Found %d parameter groups", len(variable_groups))
+                report.append(f"✅ Found {len(variable_groups)} parameter groups")
 
                 # Count parameters
                 total_params = sum(
                     len(group.get("variableList", [])) for group in variable_groups
                 )
-                _LOGGER.info("📈 Total parameters: %d", total_params)
+                report.append(f"📈 Total parameters: {total_params}")
 
-        _LOGGER.info("🎉 Connection test completed successfully")
+        report.append("🎉 Connection test completed successfully")
 
     except SolarGuardianAPIError as e:
-        _LOGGER.error("❌ SolarGuardian API Error: %s", e)
+        failure = ("❌ SolarGuardian API Error: %s", e)
     except Exception as e:
-        _LOGGER.error("❌ Unexpected error during connection test: %s", e)
+        failure = ("❌ Unexpected error during connection test: %s", e)
+    finally:
+        await hass.async_add_executor_job(_LOGGER.info, "\n".join(report))
+        # After the report, so the failure follows the steps that led to it
+        if failure is not None:
+            _LOGGER.error(*failure)
 
 
 async def _get_diagnostics_service(hass: HomeAssistant, entry_id: str) -> None:
     """Get and log diagnostic information."""
-    if entry_id not in hass.data[DOMAIN]:
+    if (entry_data := hass.data[DOMAIN].get(entry_id)) is None:
         _LOGGER.error("SolarGuardian integration not found")
         return
 
-    coordinator: SolarGuardianDataUpdateCoordinator = hass.data[DOMAIN][entry_id][
-        "coordinator"
+    coordinator: SolarGuardianDataUpdateCoordinator = entry_data["coordinator"]
+    api: SolarGuardianAPI = entry_data["api"]
+
+    report = [
+        "📋 SolarGuardian Integration Diagnostics",
+        f"🔧 API Domain: {api.domain}",
+        f"🔧 App Key: {api.app_key[:8] if len(api.app_key) > 8 else '***'}...",
+        f"⏱️  Update Interval: {coordinator.update_interval.total_seconds()} seconds",
+        f"✅ Last Update Success: {coordinator.last_update_success}",
+        f"🕒 Last Update: {coordinator.last_update_iso}",
+        f"🔄 Failed Updates: {coordinator._failed_updates}",
+        f"📡 Latest Data Enabled: {not coordinator._latest.disabled}",
     ]
-    api: SolarGuardianAPI = hass.data[DOMAIN][entry_id]["api"]
-
-    _LOGGER.info("📋 SolarGuardian Integration Diagnostics")
-    _LOGGER.info("🔧 API Domain: %s", api.domain)
-    _LOGGER.info(
-        "🔧 App Key: %s...", api.app_key[:8] if len(api.app_key) > 8 else "***"
-    )
-    _LOGGER.info(
-        "⏱️  Update Interval: %s seconds", coordinator.update_interval.total_seconds()
-    )
-    _LOGGER.info("✅ Last Update Success: %s", coordinator.last_update_success)
-    _LOGGER.info("🔄 Failed Updates: %d", coordinator._failed_updates)
-    _LOGGER.info("📡 Latest Data Enabled: %s", not coordinator._latest_data_disabled)
-    if coordinator._latest_data_disabled:
-        _LOGGER.info(
-            "   Latest data disabled after %d failures",
-            coordinator._latest_data_failures,
+    if coordinator._latest.disabled:
+        report.append(
+            f"   Latest data disabled after {coordinator._latest.failures} failures"
         )
 
     if coordinator.data:
         summary = coordinator.data.get("update_summary", {})
-        _LOGGER.info("📊 Data Summary:")
-        _LOGGER.info("   Stations: %d", summary.get("stations", 0))
-        _LOGGER.info("   Devices: %d", summary.get("devices", 0))
-        _LOGGER.info("   Sensors: %d", summary.get("sensors", 0))
-        _LOGGER.info("   Errors: %d", len(summary.get("errors", [])))
+        report.extend(
+            (
+                "📊 Data Summary:",
+                f"   Stations: {summary.get('stations', 0)}",
+                f"   Devices: {summary.get('devices', 0)}",
+                f"   Sensors: {summary.get('sensors', 0)}",
+                f"   Errors: {len(summary.get('errors', []))}",
+            )
+        )
 
         if summary.get("errors"):
-            _LOGGER.info("⚠️  Recent Errors:")
-            for error in summary["errors"][:5]:  # Show first 5 errors
-                _LOGGER.info("   • %s", error)
+            report.append("⚠️  Recent Errors:")
+            # Show first 5 errors
+            report.extend(f"   • {error}" for error in islice(summary["errors"], 5))
     else:
         _LOGGER.warning("❌ No data available from coordinator")
 
+    # Log the whole report once, off the event loop
+    await hass.async_add_executor_job(_LOGGER.info, "\n".join(report))
+
 
 async def _reset_latest_data_service(hass: HomeAssistant, entry_id: str) -> None:
     """Reset latest data fetching status."""
-    if entry_id not in hass.data[DOMAIN]:
+    if (entry_data := hass.data[DOMAIN].get(entry_id)) is None:
         _LOGGER.error("SolarGuardian integration not found")
         return
 
-    coordinator: SolarGuardianDataUpdateCoordinator = hass.data[DOMAIN][entry_id][
-        "coordinator"
-    ]
+    coordinator: SolarGuardianDataUpdateCoordinator = entry_data["coordinator"]
 
-    old_disabled = coordinator._latest_data_disabled
-    old_failures = coordinator._latest_data_failures
+    old_disabled = coordinator._latest.disabled
+    old_failures = coordinator._latest.failures
 
-    coordinator._latest_data_disabled = False
-    coordinator._latest_data_failures = 0
-    if hasattr(coordinator, "_successful_updates_since_disable"):
-        coordinator._successful_updates_since_disable = 0
+    coordinator._latest.reset()
 
     _LOGGER.info(
         "🔄 Latest data fetching reset - was disabled: %s, failures: %d",
@@ -275,87 +509,273 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+class _LatestDataState:
+    """Track failures of the latest data endpoint and when to poll it again."""
+
+    __slots__ = ("disabled", "failures", "updates_since_disable")
+
+    # Endpoint failures in a row before latest data is disabled
+    max_failures = 5
+    # Successful updates after which a disabled endpoint is tried again
+    reenable_after_updates = 10
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Enable latest data fetching and clear all counters."""
+        self.disabled = False
+        self.failures = 0
+        self.updates_since_disable = 0
+
+    def record_success(self) -> None:
+        """Record a successful latest data request."""
+        self.failures = 0
+
+    def record_failure(self) -> bool:
+        """Record an endpoint failure; return True if it disabled latest data."""
+        self.failures += 1
+        if not self.disabled and self.failures >= self.max_failures:
+            self.disabled = True
+            self.updates_since_disable = 0
+            return True
+        return False
+
+    def record_update(self) -> bool:
+        """Record a successful update; return True if it re-enabled latest data."""
+        if not self.disabled:
+            return False
+        self.updates_since_disable += 1
+        if self.updates_since_disable >= self.reenable_after_updates:
+            self.reset()
+            return True
+        return False
+
+
 class SolarGuardianDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching SolarGuardian data from the API."""
 
+    __slots__ = (
+        "api",
+        "test_mode",
+        "_api_semaphore",
+        "_failed_updates",
+        "_max_failed_updates",
+        "_latest",
+        "_last_update_ts",
+        "_last_update_iso",
+        "_last_update_iso_ts",
+        "_indexes",
+        "_index_source",
+        "_normal_interval",
+        "_parameters",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
         api: SolarGuardianAPI,
         update_interval: int = DEFAULT_UPDATE_INTERVAL,
         test_mode: bool = False,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
     ) -> None:
         """Initialize."""
         self.api = api
         self.test_mode = test_mode
+        # Bounds how many API requests a single update cycle keeps in flight
+        self._api_semaphore = asyncio.Semaphore(max_concurrent_requests)
         self._failed_updates = 0
         self._max_failed_updates = 3
-        self._latest_data_disabled = (
-            False  # Flag to disable latest data after repeated failures
+        self._latest = _LatestDataState()
+        # Kept out of self.data so that unchanged polls compare equal and do
+        # not wake every entity (see always_update below)
+        self._last_update_ts: float | None = None
+        # ISO string of _last_update_ts, formatted on first access
+        self._last_update_iso: str | None = None
+        self._last_update_iso_ts: float | None = None
+        # Lookup tables over self.data, built on first use and dropped when
+        # self.data is replaced
+        self._indexes: dict[str, dict] = {}
+        self._index_source: dict | None = None
+        # device_id -> parameters, reused between metadata refreshes
+        self._parameters: dict[Any, _DeviceParameters] = {}
+
+        # Guard against intervals that would hammer the API (or stop updates)
+        clamped_interval = min(
+            max(int(update_interval), MIN_UPDATE_INTERVAL), MAX_UPDATE_INTERVAL
         )
-        self._latest_data_failures = 0
-        self._max_latest_data_failures = 5
+        if clamped_interval != update_interval:
+            _LOGGER.warning(
+                "Update interval %ss is outside the supported range (%d-%ds), using %ds",
+                update_interval,
+                MIN_UPDATE_INTERVAL,
+                MAX_UPDATE_INTERVAL,
+                clamped_interval,
+            )
+
+        self._normal_interval = timedelta(seconds=clamped_interval)
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=update_interval),
+            update_interval=self._normal_interval,
+            always_update=False,
         )
 
-    def _create_mock_data(self) -> dict:
-        """Create mock data for testing purposes."""
-        from .const import MOCK_DEVICE, MOCK_POWER_STATION, MOCK_VARIABLE_GROUPS
+    @property
+    def last_update_iso(self) -> str | None:
+        """Return the time of the last update as an ISO 8601 string."""
+        last_update_ts = self._last_update_ts
+        if last_update_ts is None:
+            return None
+        if last_update_ts != self._last_update_iso_ts:
+            self._last_update_iso = datetime.fromtimestamp(last_update_ts).isoformat()
+            self._last_update_iso_ts = last_update_ts
+        return self._last_update_iso
+
+    def _index(self, name: str, build: Callable[[dict], dict]) -> dict:
+        """Return the named index of the current data, building it if needed."""
+        if self.data is not self._index_source:
+            self._indexes = {}
+            self._index_source = self.data
+        if (index := self._indexes.get(name)) is None:
+            index = self._indexes[name] = build(self.data or {})
+        return index
+
+    @property
+    def device_by_id(self) -> dict[Any, dict]:
+        """Return the devices of the current data keyed by device id."""
+        return self._index("device_by_id", _index_devices)
+
+    @property
+    def latest_values_by_device(self) -> dict[Any, dict[Any, Any]]:
+        """Return the parsed latest values per device id, keyed by dataPointId."""
+        return self._index("latest_values_by_device", _index_latest_values)
+
+    @property
+    def latest_identifiers_by_device(self) -> dict[Any, frozenset]:
+        """Return the dataIdentifiers reported in each device's latest data."""
+        return self._index("latest_identifiers_by_device", _index_latest_identifiers)
+
+    @property
+    def variables_by_device(self) -> dict[Any, dict[str, dict]]:
+        """Return the parameter variables per device id, keyed by dataIdentifier."""
+        return self._index("variables_by_device", _index_variables)
+
+    async def _limited(self, request: Callable[[], Awaitable[Any]]) -> Any:
+        """Run an API request while holding the concurrency semaphore."""
+        async with self._api_semaphore:
+            return await request()
+
+    async def _async_get_station_devices(self, station_id: Any) -> dict:
+        """Fetch all pages of a station's device list as one response."""
+        devices = [device async for device in self.api.iter_devices(station_id)]
+        return {"status": 0, "data": {"list": devices, "total": len(devices)}}
+
+    async def _async_update_latest_data(
+        self,
+        data: dict,
+        all_datapoints: list[dict],
+        datapoint_owners: dict[tuple, Any],
+    ) -> set:
+        """Fetch latest values for all devices and split them per device.
+
+        Return the ids of the devices that got a value for every datapoint.
+        """
+        batches = [
+            all_datapoints[start : start + LATEST_DATA_BATCH_SIZE]
+            for start in range(0, len(all_datapoints), LATEST_DATA_BATCH_SIZE)
+        ]
+        _LOGGER.debug(
+            "Fetching latest data for %d datapoints in %d request(s)",
+            len(all_datapoints),
+            len(batches),
+        )
+        latest_results = await asyncio.gather(
+            *(
+                self._limited(partial(self.api.get_latest_data_by_datapoints, batch))
+                for batch in batches
+            ),
+            return_exceptions=True,
+        )
 
-        _LOGGER.info("Creating mock data for testing (API unavailable)")
+        summary = data["update_summary"]
+        device_values: dict[Any, list] = {}
+        # device_id -> datapoints answered, to tell complete devices apart
+        device_answered: dict[Any, set] = {}
+        for latest_data in latest_results:
+            if isinstance(latest_data, SolarGuardianAPIError):
+                error_msg = f"Failed to get latest data: {latest_data}"
+                _LOGGER.warning(error_msg)
+
+                # Track failures and disable if too many
+                if (
+                    "404" in str(latest_data)
+                    or "inner error" in str(latest_data).lower()
+                ):
+                    if self._latest.record_failure():
+                        _LOGGER.warning(
+                            "Latest data endpoint consistently failing (%d failures), disabling",
+                            self._latest.failures,
+                        )
+                else:
+                    summary["errors"].append(error_msg)
+                continue
+
+            if isinstance(latest_data, Exception):
+                error_msg = f"Failed to get latest data: {latest_data}"
+                _LOGGER.warning(error_msg)
+                summary["errors"].append(error_msg)
+                continue
+
+            for data_point in latest_data.get("data", {}).get("list", []):
+                datapoint = (data_point.get("dataPointId"), data_point.get("deviceNo"))
+                device_id = datapoint_owners.get(datapoint)
+                if device_id is not None:
+                    device_values.setdefault(device_id, []).append(data_point)
+                    device_answered.setdefault(device_id, set()).add(datapoint)
+
+            self._latest.record_success()
+
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+        device_data = data["device_data"]
+        for device_id, values in device_values.items():
+            # Copy rather than mutate: the parameters response may be the API
+            # client's cached body for a 304
+            device_data[device_id] = {
+                **device_data[device_id],
+                "latest_data": {"status": 0, "data": {"list": values}},
+            }
+            if debug_enabled:
+                _LOGGER.debug(
+                    "Retrieved %d latest values for device %s", len(values), device_id
+                )
 
-        mock_data = {
-            "power_stations": {
-                "status": 0,
-                "data": {"list": [MOCK_POWER_STATION], "total": 1},
-            },
-            "devices": {
-                MOCK_POWER_STATION["id"]: {
-                    "status": 0,
-                    "data": {"list": [MOCK_DEVICE], "total": 1},
-                }
-            },
-            "device_data": {
-                MOCK_DEVICE["id"]: {
-                    "status": 0,
-                    "data": {"variableGroupList": MOCK_VARIABLE_GROUPS},
-                }
-            },
-            "status": "mock_mode",
-            "message": "Using mock data - API unavailable",
-            "last_update": datetime.now().isoformat(),
-            "update_summary": {
-                "stations": 1,
-                "devices": 1,
-                "sensors": sum(
-                    len(group["variableList"]) for group in MOCK_VARIABLE_GROUPS
-                ),
-                "errors": ["Using mock data due to API connectivity issues"],
-            },
+        datapoint_counts = Counter(datapoint_owners.values())
+        return {
+            device_id
+            for device_id, answered in device_answered.items()
+            if len(answered) == datapoint_counts[device_id]
         }
 
-        return mock_data
+    def _create_mock_data(self) -> dict:
+        """Create mock data for testing purposes."""
+        _LOGGER.info("Creating mock data for testing (API unavailable)")
+
+        self._last_update_ts = time()
+        return deepcopy(_MOCK_DATA_TEMPLATE)
 
     async def _async_update_data(self):
         """Update data via library."""
+        # Checked once per cycle so the per-device debug lines below cost
+        # nothing when debug logging is off
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
         try:
             _LOGGER.debug("Starting data update cycle")
 
-            # Test authentication first
-            try:
-                auth_success = await self.api.authenticate()
-                if not auth_success:
-                    raise UpdateFailed("Authentication failed")
-                _LOGGER.debug("Authentication successful")
-            except Exception as auth_err:
-                _LOGGER.error("Authentication failed: %s", auth_err)
-                raise UpdateFailed(f"Authentication error: {auth_err}") from auth_err
-
-            # Get power stations
+            # Get power stations (the API client authenticates lazily and
+            # reuses its cached token until it expires)
             try:
                 power_stations = await self.api.get_power_stations()
                 _LOGGER.debug(
@@ -377,179 +797,178 @@ class SolarGuardianDataUpdateCoordinator(DataUpdateCoordinator):
 
             data = {
                 "power_stations": power_stations,
-                "devices": {},
-                "device_data": {},
                 "status": "success",
-                "last_update": datetime.now().isoformat(),
                 "update_summary": {
                     "stations": len(stations_list),
                     "devices": 0,
                     "sensors": 0,
-                    "errors": [],
+                    "errors": deque(maxlen=MAX_UPDATE_ERRORS),
                 },
             }
+            summary = data["update_summary"]
 
-            # Get devices for each power station
-            for station in stations_list:
+            # Fetch the device lists of all stations concurrently
+            devices_results = await asyncio.gather(
+                *(
+                    self._limited(
+                        partial(self._async_get_station_devices, station["id"])
+                    )
+                    for station in stations_list
+                ),
+                return_exceptions=True,
+            )
+
+            data["devices"] = {
+                station["id"]: devices
+                for station, devices in zip(stations_list, devices_results, strict=True)
+                if not isinstance(devices, Exception)
+            }
+
+            all_devices = []
+            for station, devices in zip(stations_list, devices_results, strict=True):
                 station_id = station["id"]
                 station_name = station.get("powerStationName", f"Station {station_id}")
-                _LOGGER.debug(
-                    "Processing station: %s (ID: %s)", station_name, station_id
-                )
 
-                try:
-                    # Get devices using the proper API method
-                    devices = await self.api.get_devices(
-                        station_id, page_no=1, page_size=100
+                if isinstance(devices, Exception):
+                    error_msg = (
+                        f"Failed to get devices for station {station_name}: {devices}"
                     )
-                    data["devices"][station_id] = devices
+                    _LOGGER.warning(error_msg)
+                    summary["errors"].append(error_msg)
+                    continue
 
-                    devices_list = devices.get("data", {}).get("list", [])
-                    data["update_summary"]["devices"] += len(devices_list)
+                devices_list = devices.get("data", {}).get("list", [])
+                summary["devices"] += len(devices_list)
+                if debug_enabled:
                     _LOGGER.debug(
                         "Found %d devices for station %s",
                         len(devices_list),
                         station_name,
                     )
+                all_devices.extend(devices_list)
+
+            # Device parameters are static metadata: while latest data supplies
+            # the values, they are only fetched again once older than
+            # METADATA_REFRESH_INTERVAL
+            now = time()
+            collect_datapoints = not self._latest.disabled
+            device_params: dict[Any, _DeviceParameters | BaseException] = {}
+            stale_devices = []
+            for device in all_devices:
+                cached = self._parameters.get(device["id"])
+                if (
+                    cached is not None
+                    and collect_datapoints
+                    and now - cached.fetched_at < METADATA_REFRESH_INTERVAL
+                ):
+                    device_params[device["id"]] = cached
+                else:
+                    stale_devices.append(device)
 
-                    # Get device parameters for each device
-                    for device in devices_list:
-                        device_id = device["id"]
-                        device_name = device.get("equipmentName", f"Device {device_id}")
-                        _LOGGER.debug(
-                            "Processing device: %s (ID: %s)", device_name, device_id
-                        )
+            # Fetch the parameters of the remaining devices concurrently
+            params_results = await asyncio.gather(
+                *(
+                    self._limited(partial(self.api.get_device_parameters, device["id"]))
+                    for device in stale_devices
+                ),
+                return_exceptions=True,
+            )
+            for device, device_data in zip(stale_devices, params_results, strict=True):
+                device_params[device["id"]] = (
+                    device_data
+                    if isinstance(device_data, BaseException)
+                    else _scan_device_parameters(
+                        _compact_device_parameters(device_data), now
+                    )
+                )
+            if debug_enabled and len(stale_devices) < len(all_devices):
+                _LOGGER.debug(
+                    "Reusing parameters of %d device(s)",
+                    len(all_devices) - len(stale_devices),
+                )
+
+            data["device_data"] = {
+                device["id"]: params.data
+                for device in all_devices
+                if not isinstance(params := device_params[device["id"]], BaseException)
+            }
+
+            # Datapoints of all devices, requested together in the latest data phase
+            all_datapoints = []
+            # (dataPointId, deviceNo) -> device_id, to route the batched response
+            datapoint_owners = {}
+            # device_id -> parameters of the devices with datapoints
+            parameters_cache = {}
+            for device in all_devices:
+                device_id = device["id"]
+                params = device_params[device_id]
+                device_name = device.get("equipmentName", f"Device {device_id}")
 
-                        try:
-                            device_data = await self.api.get_device_parameters(
-                                device_id
-                            )
-                            data["device_data"][device_id] = device_data
-
-                            # Count parameters
-                            param_count = 0
-                            variable_groups = device_data.get("data", {}).get(
-                                "variableGroupList", []
-                            )
-                            for group in variable_groups:
-                                param_count += len(group.get("variableList", []))
-
-                            data["update_summary"]["sensors"] += param_count
-                            _LOGGER.debug(
-                                "Device %s has %d parameters", device_name, param_count
-                            )
-
-                            # Get latest data for real-time values (only if device data was successful and not disabled)
-                            if variable_groups and not self._latest_data_disabled:
-                                dev_datapoints = []
-                                for group in variable_groups:
-                                    for variable in group.get("variableList", []):
-                                        data_point_id = variable.get("dataPointId")
-                                        device_no = variable.get("deviceNo")
-                                        if data_point_id and device_no:
-                                            dev_datapoints.append(
-                                                {
-                                                    "dataPointId": data_point_id,
-                                                    "deviceNo": device_no,
-                                                }
-                                            )
-
-                                if dev_datapoints:
-                                    try:
-                                        # Use the correct method with dataPointId and deviceNo
-                                        _LOGGER.debug(
-                                            "Fetching latest data for device %s with %d datapoints",
-                                            device_name,
-                                            len(dev_datapoints),
-                                        )
-                                        latest_data = await self.api.get_latest_data_by_datapoints(
-                                            dev_datapoints
-                                        )
-                                        data["device_data"][device_id][
-                                            "latest_data"
-                                        ] = latest_data
-                                        latest_count = len(
-                                            latest_data.get("data", {}).get("list", [])
-                                        )
-                                        _LOGGER.debug(
-                                            "Retrieved %d latest values for device %s",
-                                            latest_count,
-                                            device_name,
-                                        )
-                                        # Reset failure counter on success
-                                        self._latest_data_failures = 0
-                                    except SolarGuardianAPIError as latest_err:
-                                        error_msg = f"Failed to get latest data for device {device_name}: {latest_err}"
-                                        _LOGGER.warning(error_msg)
-
-                                        # Track failures and disable if too many
-                                        if (
-                                            "404" in str(latest_err)
-                                            or "inner error" in str(latest_err).lower()
-                                        ):
-                                            self._latest_data_failures += 1
-                                            if (
-                                                self._latest_data_failures
-                                                >= self._max_latest_data_failures
-                                            ):
-                                                self._latest_data_disabled = True
-                                                _LOGGER.warning(
-                                                    "Latest data endpoint consistently failing (%d failures), disabling",
-                                                    self._latest_data_failures,
-                                                )
-                                        else:
-                                            data["update_summary"]["errors"].append(
-                                                error_msg
-                                            )
-                                    except Exception as latest_err:
-                                        error_msg = f"Failed to get latest data for device {device_name}: {latest_err}"
-                                        _LOGGER.warning(error_msg)
-                                        data["update_summary"]["errors"].append(
-                                            error_msg
-                                        )
-                                else:
-                                    _LOGGER.debug(
-                                        "No dataPointId/deviceNo found for device %s, skipping latest data",
-                                        device_name,
-                                    )
-                            elif self._latest_data_disabled:
-                                _LOGGER.debug(
-                                    "Latest data fetching disabled for device %s due to repeated failures",
-                                    device_name,
-                                )
-
-                        except Exception as err:
-                            error_msg = (
-                                f"Failed to get data for device {device_name}: {err}"
-                            )
-                            _LOGGER.warning(error_msg)
-                            data["update_summary"]["errors"].append(error_msg)
-
-                except Exception as station_err:
-                    error_msg = f"Failed to get devices for station {station_name}: {station_err}"
+                if isinstance(params, BaseException):
+                    error_msg = f"Failed to get data for device {device_name}: {params}"
                     _LOGGER.warning(error_msg)
-                    data["update_summary"]["errors"].append(error_msg)
+                    summary["errors"].append(error_msg)
+                    continue
+
+                summary["sensors"] += params.param_count
+                if params.datapoints:
+                    if params.covered:
+                        parameters_cache[device_id] = params
+                    if collect_datapoints:
+                        all_datapoints.extend(params.datapoints)
+                        for datapoint in params.datapoints:
+                            datapoint_owners[
+                                (datapoint["dataPointId"], datapoint["deviceNo"])
+                            ] = device_id
+
+                if not debug_enabled:
+                    continue
+                _LOGGER.debug(
+                    "Device %s has %d parameters", device_name, params.param_count
+                )
+                if not collect_datapoints:
+                    _LOGGER.debug(
+                        "Latest data fetching disabled for device %s due to repeated failures",
+                        device_name,
+                    )
+                elif params.param_count and not params.datapoints:
+                    _LOGGER.debug(
+                        "No dataPointId/deviceNo found for device %s, skipping latest data",
+                        device_name,
+                    )
+
+            # Fetch the latest real-time values of all devices in batched requests
+            complete_devices = set()
+            if all_datapoints:
+                complete_devices = await self._async_update_latest_data(
+                    data, all_datapoints, datapoint_owners
+                )
 
-                    # Reset failed counter on successful update
+            # Sensors without a latest value fall back to the values in the
+            # parameters, so only parameters whose every value came from latest
+            # data are reused; the others are fetched again next update
+            self._parameters = {
+                device_id: params
+                for device_id, params in parameters_cache.items()
+                if device_id in complete_devices
+            }
+
+            # Reset failed counter on successful update and leave back-off
             self._failed_updates = 0
+            if self.update_interval == BACKOFF_INTERVAL != self._normal_interval:
+                _LOGGER.info(
+                    "Updates recovered, restoring update interval to %ds",
+                    self._normal_interval.total_seconds(),
+                )
+                self.update_interval = self._normal_interval
 
             # Periodically try to re-enable latest data if it was disabled
-            if self._latest_data_disabled and data["update_summary"]["devices"] > 0:
-                # Try to re-enable every 10 successful updates
-                if hasattr(self, "_successful_updates_since_disable"):
-                    self._successful_updates_since_disable += 1
-                    if self._successful_updates_since_disable >= 10:
-                        _LOGGER.info(
-                            "Re-enabling latest data fetching after successful updates"
-                        )
-                        self._latest_data_disabled = False
-                        self._latest_data_failures = 0
-                        self._successful_updates_since_disable = 0
-                else:
-                    self._successful_updates_since_disable = 1
+            if summary["devices"] > 0 and self._latest.record_update():
+                _LOGGER.info(
+                    "Re-enabling latest data fetching after successful updates"
+                )
 
             # Log summary
-            summary = data["update_summary"]
             _LOGGER.info(
                 "Update complete: %d stations, %d devices, %d sensors, %d errors",
                 summary["stations"],
@@ -560,9 +979,10 @@ class SolarGuardianDataUpdateCoordinator(DataUpdateCoordinator):
 
             if summary["errors"]:
                 _LOGGER.warning(
-                    "Errors during update: %s", "; ".join(summary["errors"][:3])
+                    "Errors during update: %s", "; ".join(islice(summary["errors"], 3))
                 )
 
+            self._last_update_ts = time()
             return data
 
         except Exception as err:
@@ -594,7 +1014,7 @@ class SolarGuardianDataUpdateCoordinator(DataUpdateCoordinator):
             # Increase update interval if we're having repeated failures
             if self._failed_updates >= self._max_failed_updates:
                 old_interval = self.update_interval.total_seconds()
-                self.update_interval = timedelta(seconds=300)  # 5 minutes
+                self.update_interval = BACKOFF_INTERVAL
                 _LOGGER.warning(
                     "Multiple update failures (%d), increasing interval from %ds to 5 minutes",
                     self._failed_updates,
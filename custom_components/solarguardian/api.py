@@ -3,129 +3,303 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import hashlib
 import logging
+import random
+from collections.abc import AsyncIterator, Awaitable, Callable
 from datetime import datetime, timedelta
+from functools import partial
+from time import monotonic
+from urllib.parse import urlsplit
 
 import aiohttp
-from aiohttp import ClientTimeout
+import orjson
+from aiohttp import ClientTimeout, TCPConnector
 
 from .const import (
+    CONNECTION_KEEPALIVE_TIMEOUT,
+    CONNECTION_LIMIT,
+    CONNECTION_LIMIT_PER_HOST,
     DEFAULT_TIMEOUT,
+    DEVICES_PAGE_SIZE,
+    DNS_CACHE_TTL,
     ENDPOINT_AUTH,
     ENDPOINT_DEVICE_PARAMETERS,
     ENDPOINT_DEVICES,
+    ENDPOINT_GATEWAYS,
     ENDPOINT_LATEST_DATA,
     ENDPOINT_POWER_STATIONS,
     LATEST_DATA_PORT,
+    MAX_REQUEST_RETRIES,
+    MAX_VALIDATOR_CACHE_ENTRIES,
+    RATE_LIMIT_AUTH,
+    RATE_LIMIT_AUTH_BURST,
+    RATE_LIMIT_DATA,
+    RATE_LIMIT_DATA_BURST,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    RETRYABLE_HTTP_STATUSES,
+    STATUS_TOO_FREQUENT,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Tokens are valid for 2 hours; refresh slightly early so in-flight requests
+# never carry a token that expires on the way to the server
+TOKEN_LIFETIME = timedelta(hours=2)
+TOKEN_REFRESH_MARGIN = timedelta(seconds=30)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# (domain, app key, app secret digest) -> (token, expiry), shared by every
+# client in the process so config entry reloads reuse an unexpired token
+# instead of logging in again. The secret is part of the key so that a client
+# with a wrong secret never picks up a token issued for the right one.
+_TOKEN_CACHE: dict[tuple[str, str, str], tuple[str, datetime]] = {}
+
+
+def _json_dumps(obj: object) -> str:
+    """Serialize request bodies with orjson."""
+    return orjson.dumps(obj).decode()
+
+
+def _validator_cache_key(endpoint: str, payload: dict) -> str:
+    """Return the conditional request cache key of a request."""
+    return f"{endpoint}:{orjson.dumps(payload, option=orjson.OPT_SORT_KEYS).decode()}"
+
 
 class SolarGuardianAPIError(Exception):
     """Exception raised for API errors."""
 
 
+class SolarGuardianRateLimitError(SolarGuardianAPIError):
+    """Exception raised when the API rejects requests as too frequent."""
+
+
+class SolarGuardianTransientError(SolarGuardianAPIError):
+    """Exception raised for network errors and gateway failures worth retrying."""
+
+
+def _backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Return an exponential back-off delay with up to 50% jitter."""
+    return min(cap, base * 2**attempt * (1 + random.random() * 0.5))
+
+
+class _TokenBucket:
+    """Token bucket rate limiter driven by the monotonic clock.
+
+    Up to ``burst`` calls go through immediately; after that tokens refill at
+    a rate chosen so that a full burst plus one minute of refill never exceeds
+    ``calls_per_minute``.
+
+    Callers reserve their token up front (the balance may go negative) and
+    then sleep until it is due, so no lock is held while waiting and
+    concurrent callers are released in arrival order.
+    """
+
+    __slots__ = ("_capacity", "_rate", "_tokens", "_last")
+
+    def __init__(self, calls_per_minute: int, burst: int) -> None:
+        """Initialize the bucket full."""
+        if burst < 1 or calls_per_minute <= burst:
+            raise ValueError(
+                f"Token bucket needs 1 <= burst < calls_per_minute, got burst={burst}"
+                f" and calls_per_minute={calls_per_minute}"
+            )
+        self._capacity = float(burst)
+        self._rate = (calls_per_minute - burst) / 60  # tokens per second
+        self._tokens = float(burst)
+        self._last = monotonic()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._last) * self._rate
+        )
+        self._last = now
+
+    async def acquire(self) -> float:
+        """Take one token, waiting for it if needed; return the seconds waited."""
+        self._refill()
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        wait_time = -self._tokens / self._rate
+        await asyncio.sleep(wait_time)
+        return wait_time
+
+
 class SolarGuardianAPI:
     """SolarGuardian API client."""
 
+    __slots__ = (
+        "domain",
+        "app_key",
+        "app_secret",
+        "_auth_body",
+        "_token_cache_key",
+        "_host",
+        "_base_url",
+        "_urls",
+        "_latest_data_url",
+        "_session",
+        "_token",
+        "_token_expires",
+        "_data_headers",
+        "_auth_bucket",
+        "_data_bucket",
+        "_auth_lock",
+        "_validator_cache",
+    )
+
     def __init__(self, domain: str, app_key: str, app_secret: str) -> None:
         """Initialize the API client."""
         self.domain = domain
         self.app_key = app_key
         self.app_secret = app_secret
-        self._base_url = f"https://{domain}"
+        # The login body only depends on the credentials, so encode it once
+        self._auth_body = orjson.dumps({"appKey": app_key, "appSecret": app_secret})
+        self._token_cache_key = (
+            domain,
+            app_key,
+            hashlib.sha256(app_secret.encode()).hexdigest(),
+        )
+        # Accept a bare host as well as a URL with scheme or path
+        parsed = urlsplit(domain if "://" in domain else f"https://{domain}")
+        self._host = parsed.hostname or domain
+        self._base_url = f"https://{parsed.netloc or domain}"
+        # Full URL per endpoint, so requests do not rebuild it on every call
+        self._urls = {
+            endpoint: f"{self._base_url}{endpoint}"
+            for endpoint in (
+                ENDPOINT_AUTH,
+                ENDPOINT_POWER_STATIONS,
+                ENDPOINT_DEVICES,
+                ENDPOINT_GATEWAYS,
+                ENDPOINT_DEVICE_PARAMETERS,
+            )
+        }
+        self._latest_data_url = (
+            f"https://{self._host}:{LATEST_DATA_PORT}{ENDPOINT_LATEST_DATA}"
+        )
         self._session: aiohttp.ClientSession | None = None
         self._token: str | None = None
         self._token_expires: datetime | None = None
-        self._rate_limit_lock = asyncio.Lock()
-        self._last_auth_call = datetime.min
-        self._last_data_call = datetime.min
+        # Rebuilt whenever a new token is issued, shared by every data request
+        self._data_headers: dict[str, str] = _JSON_HEADERS
+        self._auth_bucket = _TokenBucket(RATE_LIMIT_AUTH, RATE_LIMIT_AUTH_BURST)
+        self._data_bucket = _TokenBucket(RATE_LIMIT_DATA, RATE_LIMIT_DATA_BURST)
+        self._auth_lock = asyncio.Lock()
+        # request key -> (ETag, Last-Modified, parsed body) for conditional requests
+        self._validator_cache: dict[str, tuple[str | None, str | None, dict]] = {}
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get aiohttp session."""
         if self._session is None:
+            connector = TCPConnector(
+                limit=CONNECTION_LIMIT,
+                limit_per_host=CONNECTION_LIMIT_PER_HOST,
+                keepalive_timeout=CONNECTION_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=DNS_CACHE_TTL,
+            )
             self._session = aiohttp.ClientSession(
-                timeout=ClientTimeout(total=DEFAULT_TIMEOUT)
+                connector=connector,
+                timeout=ClientTimeout(total=DEFAULT_TIMEOUT),
+                json_serialize=_json_dumps,
             )
         return self._session
 
     async def close(self) -> None:
-        """Close the session."""
+        """Close the session and the connection pool it owns."""
         if self._session:
             await self._session.close()
             self._session = None
 
+    async def __aenter__(self) -> SolarGuardianAPI:
+        """Return the client; its session is closed when the block exits."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the session, even if the block raised."""
+        await self.close()
+
     async def _rate_limit_auth(self) -> None:
         """Apply rate limiting for auth calls (10 per minute)."""
-        async with self._rate_limit_lock:
-            now = datetime.now()
-            time_since_last = (now - self._last_auth_call).total_seconds()
-            if time_since_last < 6:  # 10 calls per minute = 6 seconds between calls
-                wait_time = 6 - time_since_last
-                _LOGGER.debug(
-                    "Rate limiting auth call, waiting %.2f seconds", wait_time
-                )
-                await asyncio.sleep(wait_time)
-            self._last_auth_call = datetime.now()
+        wait_time = await self._auth_bucket.acquire()
+        if wait_time:
+            _LOGGER.debug("Rate limited auth call, waited %.2f seconds", wait_time)
 
     async def _rate_limit_data(self) -> None:
         """Apply rate limiting for data calls (30 per minute)."""
-        async with self._rate_limit_lock:
-            now = datetime.now()
-            time_since_last = (now - self._last_data_call).total_seconds()
-            if time_since_last < 2:  # 30 calls per minute = 2 seconds between calls
-                wait_time = 2 - time_since_last
-                _LOGGER.debug(
-                    "Rate limiting data call, waiting %.2f seconds", wait_time
-                )
-                await asyncio.sleep(wait_time)
-            self._last_data_call = datetime.now()
+        wait_time = await self._data_bucket.acquire()
+        if wait_time:
+            _LOGGER.debug("Rate limited data call, waited %.2f seconds", wait_time)
+
+    def _token_valid(self) -> bool:
+        """Return True if the cached token can still be used."""
+        return bool(
+            self._token and self._token_expires and datetime.now() < self._token_expires
+        )
 
     async def authenticate(self) -> bool:
-        """Authenticate with the API."""
-        if self._token and self._token_expires and datetime.now() < self._token_expires:
+        """Authenticate with the API.
+
+        Concurrent callers share a single login: the first one requests a
+        token while holding the auth lock, the others reuse it.
+        """
+        if self._token_valid():
             _LOGGER.debug("Using cached authentication token")
             return True
 
+        async with self._auth_lock:
+            if self._token_valid():
+                return True
+            if (cached := _TOKEN_CACHE.get(self._token_cache_key)) is not None:
+                self._set_token(*cached)
+                if self._token_valid():
+                    _LOGGER.debug("Reusing authentication token from another client")
+                    return True
+            return await self._request_token()
+
+    def _set_token(self, token: str, expires: datetime) -> None:
+        """Store a token and rebuild the headers that carry it."""
+        self._token = token
+        self._token_expires = expires
+        self._data_headers = {**_JSON_HEADERS, "X-Access-Token": token}
+
+    async def _request_token(self) -> bool:
+        """Request a new access token from the API."""
         await self._rate_limit_auth()
 
         session = await self._get_session()
-        url = f"{self._base_url}{ENDPOINT_AUTH}"
-
-        payload = {
-            "appKey": self.app_key,
-            "appSecret": self.app_secret,
-        }
-
-        headers = {
-            "Content-Type": "application/json",
-        }
+        url = self._urls[ENDPOINT_AUTH]
 
         _LOGGER.debug("Attempting authentication with domain: %s", self.domain)
 
         try:
-            async with session.post(url, json=payload, headers=headers) as response:
-                response_text = await response.text()
+            async with session.post(
+                url, data=self._auth_body, headers=_JSON_HEADERS
+            ) as response:
+                raw = await response.read()
                 _LOGGER.debug("Auth response status: %s", response.status)
 
                 if response.status != 200:
                     _LOGGER.error(
                         "Authentication failed - HTTP %s: %s",
                         response.status,
-                        response_text[:200],
+                        raw[:200].decode(errors="replace"),
                     )
                     raise SolarGuardianAPIError(
                         f"Authentication failed: HTTP {response.status}"
                     )
 
                 try:
-                    data = json.loads(response_text)
-                except json.JSONDecodeError as json_err:
+                    data = orjson.loads(raw)
+                except orjson.JSONDecodeError as json_err:
                     _LOGGER.error(
                         "Invalid JSON response from auth endpoint: %s",
-                        response_text[:200],
+                        raw[:200].decode(errors="replace"),
                     )
                     raise SolarGuardianAPIError(
                         f"Invalid JSON response: {json_err}"
@@ -146,9 +320,14 @@ class SolarGuardianAPI:
                         "Authentication response missing access token"
                     )
 
-                self._token = data["data"]["X-Access-Token"]
-                # Token expires in 2 hours
-                self._token_expires = datetime.now() + timedelta(hours=2)
+                self._set_token(
+                    data["data"]["X-Access-Token"],
+                    datetime.now() + TOKEN_LIFETIME - TOKEN_REFRESH_MARGIN,
+                )
+                _TOKEN_CACHE[self._token_cache_key] = (
+                    self._token,
+                    self._token_expires,
+                )
 
                 _LOGGER.info("Successfully authenticated with SolarGuardian API")
                 return True
@@ -173,51 +352,154 @@ class SolarGuardianAPI:
                     f"Network error during authentication: {err}"
                 ) from err
 
+    def invalidate_token(self) -> None:
+        """Drop the cached token so the next request re-authenticates."""
+        key = self._token_cache_key
+        if (cached := _TOKEN_CACHE.get(key)) is not None and cached[0] == self._token:
+            del _TOKEN_CACHE[key]
+        self._token = None
+        self._token_expires = None
+
+    async def _with_retries(self, request: Callable[[], Awaitable[dict]]) -> dict:
+        """Run a request, backing off and retrying recoverable failures.
+
+        Only "too frequent" rejections and transient network/gateway errors are
+        retried; authentication and other API errors are raised immediately.
+        """
+        attempt = 0
+        while True:
+            try:
+                return await request()
+            except SolarGuardianRateLimitError:
+                if attempt == MAX_REQUEST_RETRIES:
+                    _LOGGER.error(
+                        "API rate limit exceeded! The integration is making too many requests."
+                    )
+                    _LOGGER.error(
+                        "Please increase the update interval in integration options (recommended: 30+ seconds for multiple devices)."
+                    )
+                    raise
+                reason = "API rate limit exceeded"
+            except SolarGuardianTransientError as err:
+                if attempt == MAX_REQUEST_RETRIES:
+                    raise
+                reason = str(err)
+            delay = _backoff_delay(attempt, RETRY_BASE_DELAY, RETRY_MAX_DELAY)
+            attempt += 1
+            _LOGGER.warning(
+                "%s, retrying in %.1f seconds (%d/%d)",
+                reason,
+                delay,
+                attempt,
+                MAX_REQUEST_RETRIES,
+            )
+            await asyncio.sleep(delay)
+
     async def _make_authenticated_request(
         self, endpoint: str, payload: dict = None
     ) -> dict:
-        """Make an authenticated request to the API."""
-        await self.authenticate()
+        """Make an authenticated request to the API.
+
+        Recoverable failures are retried with exponential back-off.
+        """
+        return await self._with_retries(
+            partial(self._request_authenticated, endpoint, payload)
+        )
+
+    async def _request_authenticated(
+        self, endpoint: str, payload: dict = None, retry_on_auth_error: bool = True
+    ) -> dict:
+        """Post an authenticated request to the main API host.
+
+        A request rejected with HTTP 401 re-authenticates once and is retried.
+        If the server sent ETag/Last-Modified for the same request before, the
+        request is made conditional and a 304 returns the cached body.
+        """
+        if not self._token_valid():
+            await self.authenticate()
         await self._rate_limit_data()
 
         session = await self._get_session()
-        url = f"{self._base_url}{endpoint}"
-
-        headers = {
-            "Content-Type": "application/json",
-            "X-Access-Token": self._token,
-        }
+        if (url := self._urls.get(endpoint)) is None:
+            url = self._urls[endpoint] = f"{self._base_url}{endpoint}"
+        payload = payload or {}
+
+        headers = self._data_headers
+
+        # Keys are only built once the server has sent validators at all
+        cache_key = cached = None
+        if self._validator_cache:
+            cache_key = _validator_cache_key(endpoint, payload)
+            cached = self._validator_cache.get(cache_key)
+        if cached is not None:
+            etag, last_modified, _ = cached
+            headers = dict(headers)
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
 
         try:
-            async with session.post(
-                url, json=payload or {}, headers=headers
-            ) as response:
-                if response.status != 200:
-                    raise SolarGuardianAPIError(
-                        f"API request failed: {response.status}"
+            async with session.post(url, json=payload, headers=headers) as response:
+                if response.status != 401 or not retry_on_auth_error:
+                    return await self._read_response(
+                        endpoint, payload, response, cache_key, cached
                     )
-
-                data = await response.json()
-
-                if data.get("status") != 0:
-                    error_msg = data.get("info", "Unknown error")
-                    if data.get("status") == 5126:  # Too frequent requests
-                        _LOGGER.error(
-                            "API rate limit exceeded! The integration is making too many requests."
-                        )
-                        _LOGGER.error(
-                            "Please increase the update interval in integration options (recommended: 30+ seconds for multiple devices)."
-                        )
-                        await asyncio.sleep(10)  # Back off longer
-                    raise SolarGuardianAPIError(f"API error: {error_msg}")
-
-                return data
-
+                self.invalidate_token()
+        except (aiohttp.ClientConnectionError, TimeoutError) as err:
+            raise SolarGuardianTransientError(f"Network error: {err!r}") from err
         except aiohttp.ClientError as err:
             raise SolarGuardianAPIError(f"Network error: {err}") from err
-        except json.JSONDecodeError as err:
+        except orjson.JSONDecodeError as err:
             raise SolarGuardianAPIError(f"Invalid JSON response: {err}") from err
 
+        # Retried outside the response context so its connection is released
+        _LOGGER.debug("Access token rejected, re-authenticating")
+        return await self._request_authenticated(
+            endpoint, payload, retry_on_auth_error=False
+        )
+
+    async def _read_response(
+        self,
+        endpoint: str,
+        payload: dict,
+        response: aiohttp.ClientResponse,
+        cache_key: str | None,
+        cached: tuple[str | None, str | None, dict] | None,
+    ) -> dict:
+        """Return the parsed body of an API response, raising on errors."""
+        validator_cache = self._validator_cache
+        if response.status == 304 and cached is not None:
+            _LOGGER.debug("%s not modified, reusing cached response", endpoint)
+            # Moved to the end so the least recently used entry is evicted first
+            validator_cache[cache_key] = validator_cache.pop(cache_key, cached)
+            return cached[2]
+
+        if response.status in RETRYABLE_HTTP_STATUSES:
+            raise SolarGuardianTransientError(f"API request failed: {response.status}")
+        if response.status != 200:
+            raise SolarGuardianAPIError(f"API request failed: {response.status}")
+
+        data = orjson.loads(await response.read())
+
+        if data.get("status") != 0:
+            error_msg = data.get("info", "Unknown error")
+            if data.get("status") == STATUS_TOO_FREQUENT:
+                raise SolarGuardianRateLimitError(f"API error: {error_msg}")
+            raise SolarGuardianAPIError(f"API error: {error_msg}")
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            if cache_key is None:
+                cache_key = _validator_cache_key(endpoint, payload)
+            validator_cache.pop(cache_key, None)
+            validator_cache[cache_key] = (etag, last_modified, data)
+            if len(validator_cache) > MAX_VALIDATOR_CACHE_ENTRIES:
+                del validator_cache[next(iter(validator_cache))]
+
+        return data
+
     async def get_power_stations(self, page_no: int = 1, page_size: int = 100) -> dict:
         """Get list of power stations."""
         payload = {
@@ -239,6 +521,30 @@ class SolarGuardianAPI:
 
         return await self._make_authenticated_request(ENDPOINT_DEVICES, payload)
 
+    async def iter_devices(
+        self, power_station_id: int, page_size: int = DEVICES_PAGE_SIZE
+    ) -> AsyncIterator[dict]:
+        """Yield every device of a power station, fetching page by page."""
+        page_no = 1
+        while True:
+            response = await self.get_devices(
+                power_station_id, page_no=page_no, page_size=page_size
+            )
+            response_data = response.get("data", {})
+            devices = response_data.get("list", [])
+            for device in devices:
+                yield device
+
+            total = response_data.get("total")
+            if total is None:
+                if len(devices) < page_size:
+                    return
+            elif page_no * page_size >= total:
+                return
+            if not devices:
+                return
+            page_no += 1
+
     async def get_gateways(
         self, power_station_id: int, page_no: int = 1, page_size: int = 100
     ) -> dict:
@@ -249,9 +555,7 @@ class SolarGuardianAPI:
             "pageSize": page_size,
         }
 
-        return await self._make_authenticated_request(
-            "/epCloud/vn/openApi/getGatewayListPage", payload
-        )
+        return await self._make_authenticated_request(ENDPOINT_GATEWAYS, payload)
 
     async def get_device_parameters(self, device_id: int) -> dict:
         """Get all parameters for a device."""
@@ -273,23 +577,6 @@ class SolarGuardianAPI:
         if not data_identifiers:
             raise SolarGuardianAPIError("No data identifiers provided")
 
-        # Use the correct endpoint with port 7002 as specified in API docs
-        await self.authenticate()
-        await self._rate_limit_data()
-
-        session = await self._get_session()
-
-        # Parse domain to get host without protocol
-        domain_parts = self.domain.replace("https://", "").replace("http://", "")
-        latest_data_url = (
-            f"https://{domain_parts}:{LATEST_DATA_PORT}{ENDPOINT_LATEST_DATA}"
-        )
-
-        headers = {
-            "Content-Type": "application/json",
-            "X-Access-Token": self._token,
-        }
-
         payload = {
             "id": device_id,
             "dataIdentifiers": data_identifiers,
@@ -297,49 +584,12 @@ class SolarGuardianAPI:
 
         _LOGGER.debug(
             "Making latest data request to %s for device %d with %d identifiers",
-            latest_data_url,
+            self._latest_data_url,
             device_id,
             len(data_identifiers),
         )
 
-        try:
-            async with session.post(
-                latest_data_url, json=payload, headers=headers
-            ) as response:
-                if response.status != 200:
-                    if response.status == 404:
-                        _LOGGER.debug("Latest data endpoint not available (404 error)")
-                        raise SolarGuardianAPIError(
-                            f"Latest data endpoint not available: HTTP {response.status}"
-                        )
-                    raise SolarGuardianAPIError(
-                        f"Latest data API request failed: {response.status}"
-                    )
-
-                data = await response.json()
-
-                if data.get("status") != 0:
-                    error_msg = data.get("info", "Unknown error")
-                    if data.get("status") == 5126:  # Too frequent requests
-                        _LOGGER.error(
-                            "API rate limit exceeded during latest data request!"
-                        )
-                        _LOGGER.error(
-                            "Please increase the update interval in integration options (recommended: 30+ seconds for multiple devices)."
-                        )
-                        await asyncio.sleep(10)  # Back off longer
-                    raise SolarGuardianAPIError(f"Latest data API error: {error_msg}")
-
-                return data
-
-        except aiohttp.ClientError as err:
-            raise SolarGuardianAPIError(
-                f"Network error during latest data request: {err}"
-            ) from err
-        except json.JSONDecodeError as err:
-            raise SolarGuardianAPIError(
-                f"Invalid JSON response from latest data endpoint: {err}"
-            ) from err
+        return await self._with_retries(partial(self._request_latest_data, payload))
 
     async def get_latest_data_by_datapoints(self, dev_datapoints: list[dict]) -> dict:
         """Get latest data using the correct API endpoint with dataPointId and deviceNo.
@@ -353,61 +603,79 @@ class SolarGuardianAPI:
         if not dev_datapoints:
             raise SolarGuardianAPIError("No data points provided")
 
-        # Use the correct endpoint with port 7002 as specified in API docs
-        await self.authenticate()
-        await self._rate_limit_data()
-
-        session = await self._get_session()
-
-        # Parse domain to get host without protocol
-        domain_parts = self.domain.replace("https://", "").replace("http://", "")
-        latest_data_url = (
-            f"https://{domain_parts}:{LATEST_DATA_PORT}{ENDPOINT_LATEST_DATA}"
-        )
-
-        headers = {
-            "Content-Type": "application/json",
-            "X-Access-Token": self._token,
-        }
-
         payload = {"devDatapoints": dev_datapoints}
 
         _LOGGER.debug(
             "Making latest data request to %s with %d data points",
-            latest_data_url,
+            self._latest_data_url,
             len(dev_datapoints),
         )
 
-        try:
-            async with session.post(
-                latest_data_url, json=payload, headers=headers
-            ) as response:
-                if response.status != 200:
-                    raise SolarGuardianAPIError(
-                        f"Latest data API request failed: {response.status}"
-                    )
+        return await self._with_retries(partial(self._request_latest_data, payload))
 
-                data = await response.json()
+    async def _request_latest_data(
+        self, payload: dict, retry_on_auth_error: bool = True
+    ) -> dict:
+        """Post a request to the latest data endpoint (port 7002).
 
-                if data.get("status") != 0:
-                    error_msg = data.get("info", "Unknown error")
-                    if data.get("status") == 5126:  # Too frequent requests
-                        _LOGGER.error(
-                            "API rate limit exceeded during latest data request!"
-                        )
-                        _LOGGER.error(
-                            "Please increase the update interval in integration options (recommended: 30+ seconds for multiple devices)."
-                        )
-                        await asyncio.sleep(10)  # Back off longer
-                    raise SolarGuardianAPIError(f"Latest data API error: {error_msg}")
-
-                return data
+        A request rejected with HTTP 401 re-authenticates once and is retried.
+        """
+        if not self._token_valid():
+            await self.authenticate()
+        await self._rate_limit_data()
 
+        session = await self._get_session()
+
+        try:
+            async with session.post(
+                self._latest_data_url, json=payload, headers=self._data_headers
+            ) as response:
+                if response.status != 401 or not retry_on_auth_error:
+                    return await self._read_latest_data(response)
+                self.invalidate_token()
+        except (aiohttp.ClientConnectionError, TimeoutError) as err:
+            raise SolarGuardianTransientError(
+                f"Network error during latest data request: {err!r}"
+            ) from err
         except aiohttp.ClientError as err:
             raise SolarGuardianAPIError(
                 f"Network error during latest data request: {err}"
             ) from err
-        except json.JSONDecodeError as err:
+        except orjson.JSONDecodeError as err:
             raise SolarGuardianAPIError(
                 f"Invalid JSON response from latest data endpoint: {err}"
             ) from err
+
+        # Retried outside the response context so its connection is released
+        _LOGGER.debug(
+            "Access token rejected by latest data endpoint, re-authenticating"
+        )
+        return await self._request_latest_data(payload, retry_on_auth_error=False)
+
+    async def _read_latest_data(self, response: aiohttp.ClientResponse) -> dict:
+        """Return the parsed body of a latest data response, raising on errors."""
+        if response.status == 401:
+            self.invalidate_token()
+        if response.status in RETRYABLE_HTTP_STATUSES:
+            raise SolarGuardianTransientError(
+                f"Latest data API request failed: {response.status}"
+            )
+        if response.status != 200:
+            if response.status == 404:
+                _LOGGER.debug("Latest data endpoint not available (404 error)")
+                raise SolarGuardianAPIError(
+                    f"Latest data endpoint not available: HTTP {response.status}"
+                )
+            raise SolarGuardianAPIError(
+                f"Latest data API request failed: {response.status}"
+            )
+
+        data = orjson.loads(await response.read())
+
+        if data.get("status") != 0:
+            error_msg = data.get("info", "Unknown error")
+            if data.get("status") == STATUS_TOO_FREQUENT:
+                raise SolarGuardianRateLimitError(f"Latest data API error: {error_msg}")
+            raise SolarGuardianAPIError(f"Latest data API error: {error_msg}")
+
+        return data
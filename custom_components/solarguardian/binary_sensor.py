@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from homeassistant.components.binary_sensor import (
@@ -14,11 +15,31 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import SolarGuardianDataUpdateCoordinator
+from . import SolarGuardianDataUpdateCoordinator, device_info
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# sensor type -> (name suffix, device class, icon, state from the device entry)
+_SENSOR_SPECS: dict[
+    str, tuple[str, BinarySensorDeviceClass, str, Callable[[dict], bool]]
+] = {
+    # Online status: 1 = online, 0 = offline
+    "online": (
+        "Online",
+        BinarySensorDeviceClass.CONNECTIVITY,
+        "mdi:wifi",
+        lambda device: device.get("onlineStatus") == 1,
+    ),
+    # Alarm status: 1 = alarm, 0 = normal
+    "alarm": (
+        "Alarm",
+        BinarySensorDeviceClass.PROBLEM,
+        "mdi:alert",
+        lambda device: device.get("datapointAlarm", 0) == 1,
+    ),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -67,43 +88,22 @@ class SolarGuardianDeviceStatusSensor(CoordinatorEntity, BinarySensorEntity):
         self._device = device
         self._sensor_type = sensor_type
 
-        if sensor_type == "online":
-            self._attr_name = f"{device['equipmentName']} Online"
-            self._attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
-            self._attr_icon = "mdi:wifi"
-        elif sensor_type == "alarm":
-            self._attr_name = f"{device['equipmentName']} Alarm"
-            self._attr_device_class = BinarySensorDeviceClass.PROBLEM
-            self._attr_icon = "mdi:alert"
+        name_suffix, device_class, icon, self._extract = _SENSOR_SPECS[sensor_type]
+        self._attr_name = f"{device['equipmentName']} {name_suffix}"
+        self._attr_device_class = device_class
+        self._attr_icon = icon
 
         self._attr_unique_id = f"{device['id']}_{sensor_type}"
 
         # Device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, str(device["id"]))},
-            "name": device["equipmentName"],
-            "manufacturer": "Epever",
-            "model": device.get("productName", "Solar Inverter"),
-            "sw_version": device.get("version"),
-        }
+        self._attr_device_info = device_info(device)
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the binary sensor is on."""
-        device_id = self._device["id"]
-
-        # Look for device status in the current data
-        for _station_id, devices in self.coordinator.data.get("devices", {}).items():
-            for device in devices.get("data", {}).get("list", []):
-                if device["id"] == device_id:
-                    if self._sensor_type == "online":
-                        # Check online status (1 = online, 0 = offline)
-                        return device.get("onlineStatus") == 1
-                    elif self._sensor_type == "alarm":
-                        # Check alarm status (1 = alarm, 0 = normal)
-                        return device.get("datapointAlarm", 0) == 1
-
-        return None
+        self._attr_is_on = self._compute_is_on()
+
+    def _compute_is_on(self) -> bool | None:
+        """Return the state from the device's entry in the coordinator data."""
+        device = self.coordinator.device_by_id.get(self._device["id"])
+        return None if device is None else self._extract(device)
 
     @property
     def available(self) -> bool:
@@ -113,4 +113,5 @@ class SolarGuardianDeviceStatusSensor(CoordinatorEntity, BinarySensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        self._attr_is_on = self._compute_is_on()
         self.async_write_ha_state()
@@ -14,11 +14,15 @@ from .api import SolarGuardianAPI, SolarGuardianAPIError
 from .const import (
     CONF_APP_KEY,
     CONF_APP_SECRET,
+    CONF_MAX_CONCURRENT_REQUESTS,
     CONF_UPDATE_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
     DOMAIN_CHINA,
     DOMAIN_INTERNATIONAL,
+    MAX_UPDATE_INTERVAL,
+    MIN_UPDATE_INTERVAL,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -55,14 +59,12 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         try:
             # Test authentication
-            api = SolarGuardianAPI(
+            async with SolarGuardianAPI(
                 domain=user_input[CONF_DOMAIN],
                 app_key=user_input[CONF_APP_KEY],
                 app_secret=user_input[CONF_APP_SECRET],
-            )
-
-            await api.authenticate()
-            await api.close()
+            ) as api:
+                await api.authenticate()
 
         except SolarGuardianAPIError as err:
             _LOGGER.error("Authentication failed: %s", err)
@@ -114,7 +116,17 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         default=self.config_entry.options.get(
                             CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
                         ),
-                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=300)),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL),
+                    ),
+                    vol.Optional(
+                        CONF_MAX_CONCURRENT_REQUESTS,
+                        default=self.config_entry.options.get(
+                            CONF_MAX_CONCURRENT_REQUESTS,
+                            DEFAULT_MAX_CONCURRENT_REQUESTS,
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
                 }
             ),
         )
@@ -1,54 +1,92 @@
 """Constants for the SolarGuardian integration."""
 
-DOMAIN = "solarguardian"
+from typing import Final
+
+DOMAIN: Final = "solarguardian"
 
 # Configuration keys
-CONF_APP_KEY = "app_key"
-CONF_APP_SECRET = "app_secret"
-CONF_DOMAIN = "domain"
-CONF_UPDATE_INTERVAL = "update_interval"
-CONF_TEST_MODE = "test_mode"
+CONF_APP_KEY: Final = "app_key"
+CONF_APP_SECRET: Final = "app_secret"
+CONF_DOMAIN: Final = "domain"
+CONF_UPDATE_INTERVAL: Final = "update_interval"
+CONF_MAX_CONCURRENT_REQUESTS: Final = "max_concurrent_requests"
+CONF_TEST_MODE: Final = "test_mode"
 
 # Default values
-DEFAULT_UPDATE_INTERVAL = (
+DEFAULT_UPDATE_INTERVAL: Final = (
     15  # seconds - safe for most installations, respects 30 calls/minute API limit
 )
-DEFAULT_TIMEOUT = 30  # seconds
+MIN_UPDATE_INTERVAL: Final = 15  # seconds - anything faster floods the API
+MAX_UPDATE_INTERVAL: Final = 300  # seconds
+DEFAULT_TIMEOUT: Final = 30  # seconds
+# Device parameters are static metadata; between refreshes only the latest
+# values (and the device lists carrying online/alarm status) are polled
+METADATA_REFRESH_INTERVAL: Final = 3600  # seconds
+
+# HTTP connection pool - connections are kept alive between update cycles so
+# each cycle reuses established TLS connections instead of reconnecting
+CONNECTION_LIMIT: Final = 16
+CONNECTION_LIMIT_PER_HOST: Final = 8
+CONNECTION_KEEPALIVE_TIMEOUT: Final = 75  # seconds
+DNS_CACHE_TTL: Final = 300  # seconds
+DEFAULT_MAX_CONCURRENT_REQUESTS: Final = 8  # API requests in flight per update cycle
+MAX_UPDATE_ERRORS: Final = 50  # errors kept in the update summary per cycle
+MAX_VALIDATOR_CACHE_ENTRIES: Final = 256  # responses kept for conditional requests
 
 # API domains
-DOMAIN_CHINA = "openapi.epsolarpv.com"
-DOMAIN_INTERNATIONAL = "glapi.mysolarguardian.com"
+DOMAIN_CHINA: Final = "openapi.epsolarpv.com"
+DOMAIN_INTERNATIONAL: Final = "glapi.mysolarguardian.com"
 
 # Device classes for sensors
-DEVICE_CLASS_POWER = "power"
-DEVICE_CLASS_VOLTAGE = "voltage"
-DEVICE_CLASS_CURRENT = "current"
-DEVICE_CLASS_ENERGY = "energy"
-DEVICE_CLASS_TEMPERATURE = "temperature"
-DEVICE_CLASS_BATTERY = "battery"
+DEVICE_CLASS_POWER: Final = "power"
+DEVICE_CLASS_VOLTAGE: Final = "voltage"
+DEVICE_CLASS_CURRENT: Final = "current"
+DEVICE_CLASS_ENERGY: Final = "energy"
+DEVICE_CLASS_TEMPERATURE: Final = "temperature"
+DEVICE_CLASS_BATTERY: Final = "battery"
 
 # Units
-UNIT_WATT = "W"
-UNIT_VOLT = "V"
-UNIT_AMPERE = "A"
-UNIT_KWH = "kWh"
-UNIT_CELSIUS = "°C"
-UNIT_PERCENT = "%"
+UNIT_WATT: Final = "W"
+UNIT_VOLT: Final = "V"
+UNIT_AMPERE: Final = "A"
+UNIT_KWH: Final = "kWh"
+UNIT_CELSIUS: Final = "°C"
+UNIT_PERCENT: Final = "%"
 
 # API endpoints
-ENDPOINT_AUTH = "/epCloud/user/getAuthToken"
-ENDPOINT_POWER_STATIONS = "/epCloud/vn/openApi/getPowerStationListPage"
-ENDPOINT_DEVICES = "/epCloud/vn/openApi/getEquipmentList"
-ENDPOINT_DEVICE_PARAMETERS = "/epCloud/vn/openApi/getEquipment"
-ENDPOINT_DEVICE_HISTORY = "/epCloud/vn/openApi/getDataPoint"
-ENDPOINT_LATEST_DATA = "/history/lastDatapoint"  # Different host:port - see API docs
+ENDPOINT_AUTH: Final = "/epCloud/user/getAuthToken"
+ENDPOINT_POWER_STATIONS: Final = "/epCloud/vn/openApi/getPowerStationListPage"
+ENDPOINT_DEVICES: Final = "/epCloud/vn/openApi/getEquipmentList"
+ENDPOINT_DEVICE_PARAMETERS: Final = "/epCloud/vn/openApi/getEquipment"
+ENDPOINT_GATEWAYS: Final = "/epCloud/vn/openApi/getGatewayListPage"
+ENDPOINT_DEVICE_HISTORY: Final = "/epCloud/vn/openApi/getDataPoint"
+ENDPOINT_LATEST_DATA: Final = (
+    "/history/lastDatapoint"  # Different host:port - see API docs
+)
 
 # Special endpoint configuration for latest data (uses different host/port)
-LATEST_DATA_PORT = 7002
+LATEST_DATA_PORT: Final = 7002
+LATEST_DATA_BATCH_SIZE: Final = 200  # datapoints per latest data request
+
+# Devices requested per page when listing a power station's devices
+DEVICES_PAGE_SIZE: Final = 50
+
+# Sensors handed to Home Assistant per async_add_entities call during setup
+ENTITY_ADD_BATCH_SIZE: Final = 50
 
 # Rate limiting
-RATE_LIMIT_AUTH = 10  # calls per minute
-RATE_LIMIT_DATA = 30  # calls per minute
+RATE_LIMIT_AUTH: Final = 10  # calls per minute
+RATE_LIMIT_DATA: Final = 30  # calls per minute
+RATE_LIMIT_AUTH_BURST: Final = 2  # auth calls allowed back-to-back
+RATE_LIMIT_DATA_BURST: Final = 5  # data calls allowed back-to-back
+
+# Requests rejected as too frequent, network errors and overloaded gateways are
+# retried with jittered exponential back-off
+STATUS_TOO_FREQUENT: Final = 5126  # API status code for "too frequent requests"
+RETRYABLE_HTTP_STATUSES: Final = frozenset({502, 503, 504})
+MAX_REQUEST_RETRIES: Final = 3
+RETRY_BASE_DELAY: Final = 1.0  # seconds
+RETRY_MAX_DELAY: Final = 30.0  # seconds
 
 # Mock data for testing when API is unavailable
 MOCK_POWER_STATION = {
@@ -157,3 +195,7 @@ MOCK_VARIABLE_GROUPS = [
         ],
     },
 ]
+
+MOCK_SENSOR_COUNT: Final = sum(
+    len(group["variableList"]) for group in MOCK_VARIABLE_GROUPS
+)
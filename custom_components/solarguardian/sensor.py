@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+import re
+import sys
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -18,13 +24,13 @@ from homeassistant.const import (
     UnitOfPower,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import SolarGuardianDataUpdateCoordinator
-from .const import DOMAIN
+from . import SolarGuardianDataUpdateCoordinator, device_info
+from .const import DOMAIN, ENTITY_ADD_BATCH_SIZE
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,296 +50,302 @@ DIAGNOSTIC_SENSORS = [
     "SignalStrength",
     "DataQuality",
 ]
+_DIAGNOSTIC_RE = re.compile("|".join(map(re.escape, DIAGNOSTIC_SENSORS)))
+
+# translationChild values that can match an integer enum reading
+_ENUM_VALUE_RE = re.compile(r"-?[0-9]+")
+
+
+class SensorSpec(NamedTuple):
+    """Static configuration of a sensor type."""
+
+    name: str
+    unit: str | None = None
+    device_class: SensorDeviceClass | None = None
+    state_class: SensorStateClass | None = None
+    icon: str | None = None
+
+
+def _intern_specs(specs: dict[str, SensorSpec]) -> Mapping[str, SensorSpec]:
+    """Return a read-only view of specs with their name and icon strings interned."""
+    return MappingProxyType(
+        {
+            sensor_type: spec._replace(
+                name=sys.intern(spec.name),
+                icon=sys.intern(spec.icon) if spec.icon else spec.icon,
+            )
+            for sensor_type, spec in specs.items()
+        }
+    )
+
 
 # Mapping of parameter identifiers to sensor configurations
 # Based on the actual SolarGuardian API parameter names
-SENSOR_TYPES = {
-    # Power sensors
-    "OutputPower": {
-        "name": "Output Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": SensorDeviceClass.POWER,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:solar-power",
-    },
-    "InputPower": {
-        "name": "Input Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": SensorDeviceClass.POWER,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:solar-power",
-    },
-    "loadpower": {
-        "name": "Load Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": SensorDeviceClass.POWER,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:home-lightning-bolt",
-    },
-    # Voltage sensors
-    "BatteryVoltage": {
-        "name": "Battery Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": SensorDeviceClass.VOLTAGE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:battery",
-    },
-    "battvolt": {
-        "name": "Battery Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": SensorDeviceClass.VOLTAGE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:battery",
-    },
-    "PVVoltage": {
-        "name": "PV Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": SensorDeviceClass.VOLTAGE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:solar-panel",
-    },
-    "pvvolt": {
-        "name": "PV Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": SensorDeviceClass.VOLTAGE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:solar-panel",
-    },
-    "LoadVoltage": {
-        "name": "Load Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": SensorDeviceClass.VOLTAGE,
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    "loadvolt": {
-        "name": "Load Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": SensorDeviceClass.VOLTAGE,
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    "crtrattedbatvolt": {
-        "name": "Current Rated Battery Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": SensorDeviceClass.VOLTAGE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:battery",
-    },
-    "VLEVELFilter": {
-        "name": "Battery Rated Voltage",
-        "unit": UnitOfElectricPotential.VOLT,
-        "device_class": SensorDeviceClass.VOLTAGE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:battery",
-    },
-    # Current sensors
-    "BatteryCurrent": {
-        "name": "Battery Current",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": SensorDeviceClass.CURRENT,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:current-dc",
-    },
-    "battcurr": {
-        "name": "Battery Current",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": SensorDeviceClass.CURRENT,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:current-dc",
-    },
-    "PVCurrent": {
-        "name": "PV Current",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": SensorDeviceClass.CURRENT,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:current-dc",
-    },
-    "pvcurr": {
-        "name": "PV Current",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": SensorDeviceClass.CURRENT,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:current-dc",
-    },
-    "LoadCurrent": {
-        "name": "Load Current",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": SensorDeviceClass.CURRENT,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:current-dc",
-    },
-    "loadcurr": {
-        "name": "Load Current",
-        "unit": UnitOfElectricCurrent.AMPERE,
-        "device_class": SensorDeviceClass.CURRENT,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:current-dc",
-    },
-    # Device Information Sensors (Text)
-    "_device_serial": {
-        "name": "Serial Number",
-        "icon": "mdi:identifier",
-        "device_class": None,
-        "state_class": None,
-    },
-    "_device_gateway": {
-        "name": "Gateway ID",
-        "icon": "mdi:router-wireless",
-        "device_class": None,
-        "state_class": None,
-    },
-    "_device_gateway_name": {
-        "name": "Gateway Name",
-        "icon": "mdi:router-wireless",
-        "device_class": None,
-        "state_class": None,
-    },
-    "_device_product": {
-        "name": "Product Name",
-        "icon": "mdi:information",
-        "device_class": None,
-        "state_class": None,
-    },
-    "_device_location": {
-        "name": "Location",
-        "icon": "mdi:map-marker",
-        "device_class": None,
-        "state_class": None,
-    },
-    "_device_status_text": {
-        "name": "Status",
-        "icon": "mdi:information",
-        "device_class": None,
-        "state_class": None,
-    },
-    # Temperature sensors
-    "BatteryTemperature": {
-        "name": "Battery Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:thermometer",
-    },
-    "batttemp": {
-        "name": "Battery Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:thermometer",
-    },
-    "DeviceTemperature": {
-        "name": "Device Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:thermometer",
-    },
-    "devtemp": {
-        "name": "Device Temperature",
-        "unit": UnitOfTemperature.CELSIUS,
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:thermometer",
-    },
-    # Energy sensors
-    "GeneratedEnergyToday": {
-        "name": "Generated Energy Today",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "icon": "mdi:solar-power",
-    },
-    "genenergytoday": {
-        "name": "Generated Energy Today",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "icon": "mdi:solar-power",
-    },
-    "GeneratedEnergyTotal": {
-        "name": "Generated Energy Total",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "icon": "mdi:solar-power",
-    },
-    "genergytotal": {
-        "name": "Generated Energy Total",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "icon": "mdi:solar-power",
-    },
-    "ConsumedEnergyToday": {
-        "name": "Consumed Energy Today",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "icon": "mdi:home-lightning-bolt",
-    },
-    "consumeenergytoday": {
-        "name": "Consumed Energy Today",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "icon": "mdi:home-lightning-bolt",
-    },
-    "ConsumedEnergyTotal": {
-        "name": "Consumed Energy Total",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "icon": "mdi:home-lightning-bolt",
-    },
-    "consumeenergytotal": {
-        "name": "Consumed Energy Total",
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "icon": "mdi:home-lightning-bolt",
-    },
-    # Battery sensors
-    "BatterySOC": {
-        "name": "Battery State of Charge",
-        "unit": "%",
-        "device_class": SensorDeviceClass.BATTERY,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:battery",
-    },
-    "batterysoc": {
-        "name": "Battery State of Charge",
-        "unit": "%",
-        "device_class": SensorDeviceClass.BATTERY,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:battery",
-    },
-    "BatteryCapacity": {
-        "name": "Battery Capacity",
-        "unit": "Ah",
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:battery-high",
-    },
-    "battcap": {
-        "name": "Battery Capacity",
-        "unit": "Ah",
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:battery-high",
-    },
-    # Additional sensors that might be available
-    "pvpower": {
-        "name": "PV Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": SensorDeviceClass.POWER,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:solar-power",
-    },
-    "battpower": {
-        "name": "Battery Power",
-        "unit": UnitOfPower.WATT,
-        "device_class": SensorDeviceClass.POWER,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "icon": "mdi:battery",
-    },
-}
+SENSOR_TYPES: Mapping[str, SensorSpec] = _intern_specs(
+    {
+        # Power sensors
+        "OutputPower": SensorSpec(
+            name="Output Power",
+            unit=UnitOfPower.WATT,
+            device_class=SensorDeviceClass.POWER,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:solar-power",
+        ),
+        "InputPower": SensorSpec(
+            name="Input Power",
+            unit=UnitOfPower.WATT,
+            device_class=SensorDeviceClass.POWER,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:solar-power",
+        ),
+        "loadpower": SensorSpec(
+            name="Load Power",
+            unit=UnitOfPower.WATT,
+            device_class=SensorDeviceClass.POWER,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:home-lightning-bolt",
+        ),
+        # Voltage sensors
+        "BatteryVoltage": SensorSpec(
+            name="Battery Voltage",
+            unit=UnitOfElectricPotential.VOLT,
+            device_class=SensorDeviceClass.VOLTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:battery",
+        ),
+        "PVVoltage": SensorSpec(
+            name="PV Voltage",
+            unit=UnitOfElectricPotential.VOLT,
+            device_class=SensorDeviceClass.VOLTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:solar-panel",
+        ),
+        "LoadVoltage": SensorSpec(
+            name="Load Voltage",
+            unit=UnitOfElectricPotential.VOLT,
+            device_class=SensorDeviceClass.VOLTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        "crtrattedbatvolt": SensorSpec(
+            name="Current Rated Battery Voltage",
+            unit=UnitOfElectricPotential.VOLT,
+            device_class=SensorDeviceClass.VOLTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:battery",
+        ),
+        "VLEVELFilter": SensorSpec(
+            name="Battery Rated Voltage",
+            unit=UnitOfElectricPotential.VOLT,
+            device_class=SensorDeviceClass.VOLTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:battery",
+        ),
+        # Current sensors
+        "BatteryCurrent": SensorSpec(
+            name="Battery Current",
+            unit=UnitOfElectricCurrent.AMPERE,
+            device_class=SensorDeviceClass.CURRENT,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:current-dc",
+        ),
+        "PVCurrent": SensorSpec(
+            name="PV Current",
+            unit=UnitOfElectricCurrent.AMPERE,
+            device_class=SensorDeviceClass.CURRENT,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:current-dc",
+        ),
+        "LoadCurrent": SensorSpec(
+            name="Load Current",
+            unit=UnitOfElectricCurrent.AMPERE,
+            device_class=SensorDeviceClass.CURRENT,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:current-dc",
+        ),
+        # Device Information Sensors (Text)
+        "_device_serial": SensorSpec(
+            name="Serial Number",
+            icon="mdi:identifier",
+        ),
+        "_device_gateway": SensorSpec(
+            name="Gateway ID",
+            icon="mdi:router-wireless",
+        ),
+        "_device_gateway_name": SensorSpec(
+            name="Gateway Name",
+            icon="mdi:router-wireless",
+        ),
+        "_device_product": SensorSpec(
+            name="Product Name",
+            icon="mdi:information",
+        ),
+        "_device_location": SensorSpec(
+            name="Location",
+            icon="mdi:map-marker",
+        ),
+        "_device_status_text": SensorSpec(
+            name="Status",
+            icon="mdi:information",
+        ),
+        # Temperature sensors
+        "BatteryTemperature": SensorSpec(
+            name="Battery Temperature",
+            unit=UnitOfTemperature.CELSIUS,
+            device_class=SensorDeviceClass.TEMPERATURE,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:thermometer",
+        ),
+        "DeviceTemperature": SensorSpec(
+            name="Device Temperature",
+            unit=UnitOfTemperature.CELSIUS,
+            device_class=SensorDeviceClass.TEMPERATURE,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:thermometer",
+        ),
+        # Energy sensors
+        "GeneratedEnergyToday": SensorSpec(
+            name="Generated Energy Today",
+            unit=UnitOfEnergy.KILO_WATT_HOUR,
+            device_class=SensorDeviceClass.ENERGY,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            icon="mdi:solar-power",
+        ),
+        "GeneratedEnergyTotal": SensorSpec(
+            name="Generated Energy Total",
+            unit=UnitOfEnergy.KILO_WATT_HOUR,
+            device_class=SensorDeviceClass.ENERGY,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            icon="mdi:solar-power",
+        ),
+        "ConsumedEnergyToday": SensorSpec(
+            name="Consumed Energy Today",
+            unit=UnitOfEnergy.KILO_WATT_HOUR,
+            device_class=SensorDeviceClass.ENERGY,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            icon="mdi:home-lightning-bolt",
+        ),
+        "ConsumedEnergyTotal": SensorSpec(
+            name="Consumed Energy Total",
+            unit=UnitOfEnergy.KILO_WATT_HOUR,
+            device_class=SensorDeviceClass.ENERGY,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            icon="mdi:home-lightning-bolt",
+        ),
+        # Battery sensors
+        "BatterySOC": SensorSpec(
+            name="Battery State of Charge",
+            unit="%",
+            device_class=SensorDeviceClass.BATTERY,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:battery",
+        ),
+        "BatteryCapacity": SensorSpec(
+            name="Battery Capacity",
+            unit="Ah",
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:battery-high",
+        ),
+        # Additional sensors that might be available
+        "pvpower": SensorSpec(
+            name="PV Power",
+            unit=UnitOfPower.WATT,
+            device_class=SensorDeviceClass.POWER,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:solar-power",
+        ),
+        "battpower": SensorSpec(
+            name="Battery Power",
+            unit=UnitOfPower.WATT,
+            device_class=SensorDeviceClass.POWER,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:battery",
+        ),
+    }
+)
+
+
+# Short lowercase identifiers some devices report for the same parameters
+SENSOR_TYPE_ALIASES: Mapping[str, str] = MappingProxyType(
+    {
+        "battvolt": "BatteryVoltage",
+        "pvvolt": "PVVoltage",
+        "loadvolt": "LoadVoltage",
+        "battcurr": "BatteryCurrent",
+        "pvcurr": "PVCurrent",
+        "loadcurr": "LoadCurrent",
+        "batttemp": "BatteryTemperature",
+        "devtemp": "DeviceTemperature",
+        "genenergytoday": "GeneratedEnergyToday",
+        "genergytotal": "GeneratedEnergyTotal",
+        "consumeenergytoday": "ConsumedEnergyToday",
+        "consumeenergytotal": "ConsumedEnergyTotal",
+        "batterysoc": "BatterySOC",
+        "battcap": "BatteryCapacity",
+    }
+)
+
+# Every dataIdentifier with a SENSOR_TYPES entry, directly or through an alias,
+# resolved to its spec so setup needs a single lookup per variable
+_SPECS_BY_IDENTIFIER: Mapping[str, SensorSpec] = MappingProxyType(
+    {
+        **SENSOR_TYPES,
+        **{
+            alias: SENSOR_TYPES[sensor_type]
+            for alias, sensor_type in SENSOR_TYPE_ALIASES.items()
+        },
+    }
+)
+
+# Device "status" code -> text shown by the device status sensor
+_STATUS_TEXT: Mapping[int, str] = MappingProxyType({1: "Online", 0: "Offline"})
+
+# Device information sensor -> device entry fields holding its value
+# (the first field present wins)
+_DEVICE_INFO_FIELDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("_device_serial", ("equipmentNo",)),
+    ("_device_gateway", ("gatewayId",)),
+    ("_device_gateway_name", ("gatewayName",)),
+    ("_device_product", ("productName", "productNameE")),
+    ("_device_location", ("address",)),
+)
+
+
+@lru_cache(maxsize=256)
+def _generic_sensor_spec(name: str, unit: str | None) -> SensorSpec:
+    """Return the spec for a parameter without a SENSOR_TYPES entry."""
+    return SensorSpec(
+        name=sys.intern(name) if isinstance(name, str) else name,
+        unit=sys.intern(unit) if isinstance(unit, str) else unit,
+        icon="mdi:gauge",
+    )
+
+
+def _enum_translations(translation_child: Any) -> dict[int, str | None]:
+    """Map integer enum values to text, English if available, else Chinese.
+
+    The first mapping of a value wins. Entries that are not mappings or whose
+    value is not an integer string could never match a reading and are skipped.
+    """
+    translations: dict[int, str | None] = {}
+    if not isinstance(translation_child, list):
+        return translations
+    for translation in translation_child:
+        if not isinstance(translation, dict):
+            continue
+        value = str(translation.get("value"))
+        if _ENUM_VALUE_RE.fullmatch(value):
+            translations.setdefault(
+                int(value), translation.get("resultE") or translation.get("result")
+            )
+    return translations
+
+
+def _device_field(device: dict[str, Any], fields: tuple[str, ...]) -> Any:
+    """Return the first of the given fields present in a device entry."""
+    for field in fields:
+        if field in device:
+            return device[field]
+    return "Unknown"
 
 
 async def async_setup_entry(
@@ -350,14 +362,31 @@ async def async_setup_entry(
     if not coordinator.data:
         _LOGGER.warning("No initial data available for sensor setup")
 
-        # Set up a listener to create sensors when data becomes available
-        async def _async_data_updated():
-            if coordinator.data and coordinator.data.get("devices"):
-                _LOGGER.info("Data now available, setting up sensors")
-                await _setup_sensors_from_data(coordinator, async_add_entities)
+        # Set up a one-shot listener to create sensors when data becomes available
+        @callback
+        def _async_data_updated() -> None:
+            nonlocal remove_listener
+            if remove_listener is None or not (
+                coordinator.data and coordinator.data.get("devices")
+            ):
+                return
+            _LOGGER.info("Data now available, setting up sensors")
+            remove_listener()
+            remove_listener = None
+            hass.async_create_task(
+                _setup_sensors_from_data(coordinator, async_add_entities)
+            )
+
+        @callback
+        def _async_remove_listener() -> None:
+            if remove_listener is not None:
+                remove_listener()
 
-        # Listen for data updates
-        coordinator.async_add_listener(_async_data_updated)
+        # Listen for data updates until the sensors have been set up
+        remove_listener: CALLBACK_TYPE | None = coordinator.async_add_listener(
+            _async_data_updated
+        )
+        config_entry.async_on_unload(_async_remove_listener)
         return
 
     # Set up sensors immediately if data is available
@@ -392,9 +421,12 @@ async def _setup_sensors_from_data(
     # Create sensors for each device
     for station_id, devices in coordinator.data.get("devices", {}).items():
         station_devices = devices.get("data", {}).get("list", [])
-        _LOGGER.debug(
-            "Processing %d devices from station %s", len(station_devices), station_id
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Processing %d devices from station %s",
+                len(station_devices),
+                station_id,
+            )
 
         for device in station_devices:
             device_id = device["id"]
@@ -407,122 +439,132 @@ async def _setup_sensors_from_data(
                 )
                 continue
 
-            # Initialize device sensor counter
-            device_sensors = 0
-
             # Add device information sensors (Serial, Gateway, Location, etc.)
             # These are text sensors showing device metadata
-            device_info_sensors = [
-                ("_device_serial", device.get("equipmentNo", "Unknown")),
-                ("_device_gateway", device.get("gatewayId", "Unknown")),
-                ("_device_gateway_name", device.get("gatewayName", "Unknown")),
-                (
-                    "_device_product",
-                    device.get("productName", device.get("productNameE", "Unknown")),
-                ),
-                ("_device_location", device.get("address", "Unknown")),
-                (
-                    "_device_status_text",
-                    "Online" if device.get("status") == 1 else "Offline",
-                ),
+            device_entities: list[SensorEntity] = [
+                SolarGuardianDeviceInfoSensor(
+                    coordinator, device, sensor_id, SENSOR_TYPES[sensor_id], value
+                )
+                for sensor_id, fields in _DEVICE_INFO_FIELDS
+                if (value := _device_field(device, fields)) != "Unknown"
             ]
-
-            for sensor_id, sensor_value in device_info_sensors:
-                if sensor_id in SENSOR_TYPES and sensor_value != "Unknown":
-                    entities.append(
-                        SolarGuardianDeviceInfoSensor(
-                            coordinator,
-                            device,
-                            sensor_id,
-                            SENSOR_TYPES[sensor_id],
-                            sensor_value,
-                        )
-                    )
-                    device_sensors += 1
+            device_entities.append(
+                SolarGuardianDeviceInfoSensor(
+                    coordinator,
+                    device,
+                    "_device_status_text",
+                    SENSOR_TYPES["_device_status_text"],
+                    _STATUS_TEXT.get(device.get("status"), "Offline"),
+                )
+            )
 
             # Create sensors for each parameter group
-            for group in device_data.get("data", {}).get("variableGroupList", []):
-                group_name = group.get(
-                    "variableGroupNameE", group.get("variableGroupNameC", "Unknown")
+            device_entities.extend(
+                sensor
+                for group in device_data.get("data", {}).get("variableGroupList", [])
+                for variable in group.get("variableList", [])
+                if variable.get("dataIdentifier")
+                and (sensor := _build_sensor(coordinator, device, variable, group))
+                is not None
+            )
+            entities.extend(device_entities)
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Created %d sensors for device %s",
+                    len(device_entities),
+                    device_name,
                 )
-                for variable in group.get("variableList", []):
-                    data_identifier = variable.get("dataIdentifier")
-                    if not data_identifier:
-                        continue
-
-                    # Skip configuration parameters (mode="1")
-                    # These are device settings that are not provided by the latest_data endpoint
-                    # mode="0" = real-time sensor (has values)
-                    # mode="1" = configuration parameter (no values from API)
-                    variable_mode = variable.get("mode", "0")
-                    if variable_mode == "1":
-                        _LOGGER.debug(
-                            "Skipping configuration parameter: %s (mode=1, not readable via API)",
-                            variable.get("variableNameE", data_identifier),
-                        )
-                        continue
-
-                    if data_identifier in SENSOR_TYPES:
-                        entities.append(
-                            SolarGuardianSensor(
-                                coordinator,
-                                device,
-                                variable,
-                                SENSOR_TYPES[data_identifier],
-                            )
-                        )
-                        device_sensors += 1
-                    else:
-                        # Create generic sensor for unknown parameters
-                        _LOGGER.debug(
-                            "Creating generic sensor for unknown parameter: %s in group %s",
-                            data_identifier,
-                            group_name,
-                        )
-                        entities.append(
-                            SolarGuardianSensor(
-                                coordinator,
-                                device,
-                                variable,
-                                {
-                                    "name": variable.get(
-                                        "variableNameE",
-                                        variable.get("variableNameC", data_identifier),
-                                    ),
-                                    "unit": variable.get("unit"),
-                                    "icon": "mdi:gauge",
-                                },
-                            )
-                        )
-                        device_sensors += 1
 
-            _LOGGER.info(
-                "Created %d sensors for device %s", device_sensors, device_name
+    _LOGGER.info("Total sensors created: %d", len(entities))
+    # Add the entities in batches, yielding to the event loop in between
+    for start in range(0, len(entities), ENTITY_ADD_BATCH_SIZE):
+        async_add_entities(entities[start : start + ENTITY_ADD_BATCH_SIZE])
+        await asyncio.sleep(0)
+
+
+def _build_sensor(
+    coordinator: SolarGuardianDataUpdateCoordinator,
+    device: dict[str, Any],
+    variable: dict[str, Any],
+    group: dict[str, Any],
+) -> SolarGuardianSensor | None:
+    """Return the sensor for a device variable, or None if it is not readable."""
+    data_identifier = variable["dataIdentifier"]
+
+    # Skip configuration parameters (mode="1")
+    # These are device settings that are not provided by the latest_data endpoint
+    # mode="0" = real-time sensor (has values)
+    # mode="1" = configuration parameter (no values from API)
+    if variable.get("mode", "0") == "1":
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Skipping configuration parameter: %s (mode=1, not readable via API)",
+                variable.get("variableNameE", data_identifier),
             )
+        return None
 
-    _LOGGER.info("Total sensors created: %d", len(entities))
-    if entities:
-        async_add_entities(entities)
+    sensor_config = _SPECS_BY_IDENTIFIER.get(data_identifier)
+    if sensor_config is None:
+        # Create generic sensor for unknown parameters
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Creating generic sensor for unknown parameter: %s in group %s",
+                data_identifier,
+                group.get(
+                    "variableGroupNameE", group.get("variableGroupNameC", "Unknown")
+                ),
+            )
+        sensor_config = _generic_sensor_spec(
+            variable.get("variableNameE")
+            or variable.get("variableNameC")
+            or data_identifier,
+            variable.get("unit"),
+        )
+    return SolarGuardianSensor(coordinator, device, variable, sensor_config)
 
 
 class SolarGuardianSensor(CoordinatorEntity, SensorEntity):
     """Representation of a SolarGuardian sensor."""
 
+    __slots__ = (
+        "_device",
+        "_device_id",
+        "_variable",
+        "_sensor_config",
+        "_data_identifier",
+        "_data_point_id",
+        "_translation_map",
+        "_decimal_divisor",
+        "_device_data",
+        "_last_valid_value",
+        "_value_source",
+    )
+
     def __init__(
         self,
         coordinator: SolarGuardianDataUpdateCoordinator,
         device: dict[str, Any],
         variable: dict[str, Any],
-        sensor_config: dict[str, Any],
+        sensor_config: SensorSpec,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
 
         self._device = device
+        self._device_id = device["id"]
         self._variable = variable
         self._sensor_config = sensor_config
-        self._attr_name = f"{device['equipmentName']} {sensor_config['name']}"
-        self._attr_unique_id = f"{device['id']}_{variable['dataIdentifier']}"
+        # Variable metadata never changes, so resolve it once here
+        self._data_identifier = variable["dataIdentifier"]
+        self._data_point_id = variable.get("dataPointId")
+        # Enum values: integer value -> text
+        self._translation_map = _enum_translations(variable.get("translationChild"))
+        decimal = variable.get("decimal", "0")
+        decimal_places = int(decimal) if decimal and decimal.isdigit() else 0
+        self._decimal_divisor = 10**decimal_places
+        self._attr_name = f"{device['equipmentName']} {sensor_config.name}"
+        self._attr_unique_id = f"{device['id']}_{self._data_identifier}"
 
         # Check if this is an enum sensor (has translationChild)
         has_translation = bool(variable.get("translationChild"))
@@ -531,205 +573,208 @@ class SolarGuardianSensor(CoordinatorEntity, SensorEntity):
         # For enum sensors (text values), don't set device_class, state_class, or unit
         # This tells Home Assistant to treat them as text sensors
         if not has_translation:
-            self._attr_native_unit_of_measurement = sensor_config.get("unit")
-            self._attr_device_class = sensor_config.get("device_class")
-            self._attr_state_class = sensor_config.get("state_class")
-
-        self._attr_icon = sensor_config.get("icon")
+            self._attr_native_unit_of_measurement = sensor_config.unit
+            self._attr_device_class = sensor_config.device_class
+            self._attr_state_class = sensor_config.state_class
+            # Let Home Assistant round for display instead of formatting values
+            if decimal_places:
+                self._attr_suggested_display_precision = decimal_places
+
+        self._attr_icon = sensor_config.icon
+        # Check if this sensor should be marked as diagnostic
+        if _DIAGNOSTIC_RE.search(self._data_identifier):
+            self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
         # Device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, str(device["id"]))},
-            "name": device["equipmentName"],
-            "manufacturer": "Epever",
-            "model": device.get("productName", "Solar Inverter"),
-            "sw_version": device.get("version"),
-        }
-
-    def _translate_value(self, value: float, translation_child: list) -> str | None:
+        self._attr_device_info = device_info(device)
+
+        self._last_valid_value: str | float | None = None
+        self._value_source = "none"
+        self._device_data = self._lookup_device_data()
+        self._attr_available = self._compute_available()
+        self._attr_native_value = self._compute_native_value()
+        self._attr_extra_state_attributes = self._compute_extra_state_attributes()
+
+    def _lookup_device_data(self) -> dict[str, Any]:
+        """Return this sensor's device entry of the current coordinator data."""
+        data = self.coordinator.data
+        if not data:
+            return {}
+        return data.get("device_data", {}).get(self._device_id, {})
+
+    def _translate_value(self, value: float) -> str | None:
         """Translate numeric value to text using translationChild mappings.
 
         Args:
             value: Numeric value from sensor (e.g., 0, 1, 2)
-            translation_child: List of translation mappings from API
 
         Returns:
             Translated text value (e.g., "Not Charging") or None if no match
-        """
-        # Convert value to string for comparison (API uses string values in translations)
-        value_str = str(int(value))  # Convert 0.0 to "0", 1.0 to "1", etc.
-
-        for translation in translation_child:
-            if translation.get("value") == value_str:
-                # Use English result if available, fallback to Chinese
-                return translation.get("resultE") or translation.get("result")
 
-        # No translation found
-        return None
+        Raises:
+            ValueError, OverflowError: value is NaN or infinite
+        """
+        # Translations are keyed by the integer value: 0.0 -> 0, 1.0 -> 1, etc.
+        return self._translation_map.get(int(value))
 
-    @property
-    def native_value(self) -> str | float | None:
-        """Return the native value of the sensor."""
-        device_id = self._device["id"]
+    def _compute_native_value(self) -> str | float | None:
+        """Return the sensor value from the current coordinator data."""
+        device_id = self._device_id
         device_name = self._device.get("equipmentName", "Unknown")
-        device_data = self.coordinator.data.get("device_data", {}).get(device_id, {})
+        device_data = self._device_data
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
 
         if not device_data:
-            _LOGGER.debug(
-                "No device data available for %s (ID: %s)", device_name, device_id
-            )
+            if debug:
+                _LOGGER.debug(
+                    "No device data available for %s (ID: %s)", device_name, device_id
+                )
             return None
 
-        data_identifier = self._variable["dataIdentifier"]
-        data_point_id = self._variable.get("dataPointId")
+        data_identifier = self._data_identifier
+        data_point_id = self._data_point_id
 
         # First try to get value from latest data
         # NOTE: latest_data response uses dataPointId, not dataIdentifier!
-        latest_data = device_data.get("latest_data", {})
-        if latest_data.get("data", {}).get("list") and data_point_id:
-            for data_point in latest_data["data"]["list"]:
-                if data_point.get("dataPointId") == data_point_id:
+        latest_values = self.coordinator.latest_values_by_device.get(device_id)
+        if latest_values and data_point_id:
+            if data_point_id in latest_values:
+                # NOTE: latest_data values are ALREADY formatted with decimals applied
+                # The API returns "50.00" not "5000", so the coordinator only parses
+                # them to floats once per update
+                value = latest_values[data_point_id]
+                if not isinstance(value, float):
+                    _LOGGER.warning(
+                        "Failed to convert value for %s: %s (not numeric)",
+                        data_identifier,
+                        value,
+                    )
+                    return value
+
+                # Check if this parameter has translation mappings (enum values)
+                if self._translation_map:
+                    # Value needs to be translated (e.g., 0 -> "Not Charging")
                     try:
-                        # NOTE: latest_data values are ALREADY formatted with decimals applied
-                        # The API returns "50.00" not "5000", so we use the value as-is
-                        value = float(data_point.get("value", 0))
-
-                        # Check if this parameter has translation mappings (enum values)
-                        translation_child = self._variable.get("translationChild", [])
-                        if translation_child:
-                            # Value needs to be translated (e.g., 0 -> "Not Charging")
-                            translated_value = self._translate_value(
-                                value, translation_child
-                            )
-                            if translated_value is not None:
-                                _LOGGER.debug(
-                                    "Sensor %s (%s) got translated value from latest_data: %s -> %s",
-                                    self.name,
-                                    data_identifier,
-                                    value,
-                                    translated_value,
-                                )
-                                if hasattr(self, "_last_valid_value"):
-                                    self._last_valid_value = translated_value
-                                if hasattr(self, "_value_source"):
-                                    self._value_source = "latest_data (translated)"
-                                return translated_value
-
-                        _LOGGER.debug(
-                            "Sensor %s (%s) got value from latest_data: %s",
-                            self.name,
-                            data_identifier,
-                            value,
-                        )
-                        if hasattr(self, "_last_valid_value"):
-                            self._last_valid_value = value
-                        if hasattr(self, "_value_source"):
-                            self._value_source = "latest_data"
-                        return value
-                    except (ValueError, TypeError) as err:
+                        translated_value = self._translate_value(value)
+                    except (ValueError, OverflowError) as err:
+                        # NaN and infinity have no integer value to look up
                         _LOGGER.warning(
                             "Failed to convert value for %s: %s (error: %s)",
                             data_identifier,
-                            data_point.get("value"),
+                            value,
                             err,
                         )
-                        return data_point.get("value")
+                        return value
+                    if translated_value is not None:
+                        if debug:
+                            _LOGGER.debug(
+                                "Sensor %s (%s) got translated value from latest_data: %s -> %s",
+                                self.name,
+                                data_identifier,
+                                value,
+                                translated_value,
+                            )
+                        self._last_valid_value = translated_value
+                        self._value_source = "latest_data (translated)"
+                        return translated_value
+
+                if debug:
+                    _LOGGER.debug(
+                        "Sensor %s (%s) got value from latest_data: %s",
+                        self.name,
+                        data_identifier,
+                        value,
+                    )
+                self._last_valid_value = value
+                self._value_source = "latest_data"
+                return value
         else:
-            _LOGGER.debug(
-                "No latest_data available for %s - latest_data status: %s",
-                device_name,
-                "present but empty" if "latest_data" in device_data else "not present",
-            )
+            if debug:
+                _LOGGER.debug(
+                    "No latest_data available for %s - latest_data status: %s",
+                    device_name,
+                    (
+                        "present but empty"
+                        if "latest_data" in device_data
+                        else "not present"
+                    ),
+                )
 
         # Fallback to checking variable configuration data
-        for group in device_data.get("data", {}).get("variableGroupList", []):
-            for variable in group.get("variableList", []):
-                if variable.get("dataIdentifier") == data_identifier:
-                    # Try multiple value fields
-                    for value_field in ["currentValue", "value", "defaultValue"]:
-                        if value_field in variable:
-                            try:
-                                value = float(variable[value_field])
-                                # Apply decimal formatting if specified
-                                decimal = variable.get("decimal", "0")
-                                if decimal and decimal.isdigit():
-                                    value = value / (10 ** int(decimal))
-                                _LOGGER.debug(
-                                    "Sensor %s (%s) got value from variable.%s: %s",
-                                    self.name,
-                                    data_identifier,
-                                    value_field,
-                                    value,
-                                )
-                                if hasattr(self, "_last_valid_value"):
-                                    self._last_valid_value = value
-                                if hasattr(self, "_value_source"):
-                                    self._value_source = f"variable.{value_field}"
-                                return value
-                            except (ValueError, TypeError):
-                                # Try returning as-is if not numeric
-                                return variable[value_field]
+        variable = self.coordinator.variables_by_device.get(device_id, {}).get(
+            data_identifier
+        )
+        if variable is not None:
+            # Try multiple value fields
+            for value_field in ("currentValue", "value", "defaultValue"):
+                if value_field in variable:
+                    try:
+                        # Apply decimal formatting if specified
+                        value = float(variable[value_field]) / self._decimal_divisor
+                        if debug:
+                            _LOGGER.debug(
+                                "Sensor %s (%s) got value from variable.%s: %s",
+                                self.name,
+                                data_identifier,
+                                value_field,
+                                value,
+                            )
+                        self._last_valid_value = value
+                        self._value_source = f"variable.{value_field}"
+                        return value
+                    except (ValueError, TypeError):
+                        # Try returning as-is if not numeric
+                        return variable[value_field]
 
         # Log when we can't find any value
-        # Check if attribute exists (backward compatibility with existing sensors)
-        if hasattr(self, "_last_valid_value") and self._last_valid_value is not None:
+        if self._last_valid_value is not None:
             # Return last known value if we have one
+            if debug:
+                _LOGGER.debug(
+                    "No current value for sensor %s (%s) in device %s - using last known value: %s",
+                    self.name,
+                    data_identifier,
+                    device_name,
+                    self._last_valid_value,
+                )
+            self._value_source = "last_known (stale)"
+            return self._last_valid_value
+
+        if debug:
             _LOGGER.debug(
-                "No current value for sensor %s (%s) in device %s - using last known value: %s",
+                "No value found for sensor %s (%s) in device %s - parameter not in latest_data",
                 self.name,
                 data_identifier,
                 device_name,
-                self._last_valid_value,
             )
-            if hasattr(self, "_value_source"):
-                self._value_source = "last_known (stale)"
-            return self._last_valid_value
-
-        _LOGGER.debug(
-            "No value found for sensor %s (%s) in device %s - parameter not in latest_data",
-            self.name,
-            data_identifier,
-            device_name,
-        )
-        if hasattr(self, "_value_source"):
-            self._value_source = "none"
+        self._value_source = "none"
         return None
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
+    def _compute_available(self) -> bool:
+        """Return if entity is available for the current coordinator data."""
         # If coordinator has never successfully updated, entity is unavailable
         if not self.coordinator.last_update_success and not self.coordinator.data:
             return False
 
         # If we have data, check if our specific device data is available
         if self.coordinator.data:
-            device_id = self._device["id"]
-            device_data = self.coordinator.data.get("device_data", {}).get(
-                device_id, {}
-            )
             # Entity is available if we have device data, even if latest update failed
-            return bool(device_data)
+            return bool(self._device_data)
 
         # Fallback to coordinator success status
         return self.coordinator.last_update_success
 
     @property
-    def entity_category(self) -> EntityCategory | None:
-        """Return the entity category if this is a diagnostic sensor."""
-        data_identifier = self._variable.get("dataIdentifier", "")
-        # Check if this sensor should be marked as diagnostic
-        if any(diag in data_identifier for diag in DIAGNOSTIC_SENSORS):
-            return EntityCategory.DIAGNOSTIC
-        return None
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self._attr_available
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
+    def _compute_extra_state_attributes(self) -> dict[str, Any]:
+        """Return additional state attributes for the current coordinator data."""
         attrs = {
             "data_identifier": self._variable.get("dataIdentifier"),
             "variable_name": self._variable.get("variableName"),
-            "data_source": getattr(self, "_value_source", None) or "none",
+            "data_source": self._value_source,
         }
 
         # Add parameter info for diagnostic purposes
@@ -739,14 +784,11 @@ class SolarGuardianSensor(CoordinatorEntity, SensorEntity):
             attrs["api_unit"] = self._variable["unit"]
 
         # Show if parameter has real-time data available
-        device_id = self._device["id"]
-        device_data = self.coordinator.data.get("device_data", {}).get(device_id, {})
-        latest_data = device_data.get("latest_data", {})
-        if latest_data.get("data", {}).get("list"):
-            has_latest = any(
-                dp.get("dataIdentifier") == self._variable.get("dataIdentifier")
-                for dp in latest_data["data"]["list"]
-            )
+        latest_identifiers = self.coordinator.latest_identifiers_by_device.get(
+            self._device_id
+        )
+        if latest_identifiers is not None:
+            has_latest = self._data_identifier in latest_identifiers
             attrs["has_latest_data"] = has_latest
             if not has_latest:
                 attrs["info"] = "Parameter not included in real-time updates"
@@ -756,61 +798,82 @@ class SolarGuardianSensor(CoordinatorEntity, SensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        self._device_data = self._lookup_device_data()
+        previous_state = (
+            self._attr_available,
+            self._attr_native_value,
+            self._attr_extra_state_attributes,
+        )
+        self._attr_available = self._compute_available()
+        self._attr_native_value = self._compute_native_value()
+        self._attr_extra_state_attributes = self._compute_extra_state_attributes()
+        if previous_state == (
+            self._attr_available,
+            self._attr_native_value,
+            self._attr_extra_state_attributes,
+        ):
+            return
         self.async_write_ha_state()
 
 
 class SolarGuardianDeviceInfoSensor(CoordinatorEntity, SensorEntity):
     """Representation of a SolarGuardian device information sensor (text)."""
 
+    # Device info sensors are diagnostic
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    __slots__ = (
+        "_device",
+        "_device_id",
+        "_sensor_id",
+        "_is_status",
+        "_sensor_config",
+        "_value",
+    )
+
     def __init__(
         self,
         coordinator: SolarGuardianDataUpdateCoordinator,
         device: dict[str, Any],
         sensor_id: str,
-        sensor_config: dict[str, Any],
+        sensor_config: SensorSpec,
         value: str,
     ) -> None:
         """Initialize the device info sensor."""
         super().__init__(coordinator)
 
         self._device = device
+        self._device_id = device["id"]
         self._sensor_id = sensor_id
+        self._is_status = sensor_id == "_device_status_text"
         self._sensor_config = sensor_config
         self._value = value
-        self._attr_name = f"{device['equipmentName']} {sensor_config['name']}"
+        self._attr_name = f"{device['equipmentName']} {sensor_config.name}"
         self._attr_unique_id = f"{device['id']}{sensor_id}"
 
         # Set sensor attributes (text sensors have no unit/device_class)
-        self._attr_icon = sensor_config.get("icon")
+        self._attr_icon = sensor_config.icon
 
         # Device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, str(device["id"]))},
-            "name": device["equipmentName"],
-            "manufacturer": "Epever",
-            "model": device.get("productName", "Solar Inverter"),
-            "sw_version": device.get("version"),
-        }
+        self._attr_device_info = device_info(device)
 
-    @property
-    def native_value(self) -> str:
-        """Return the value of the sensor."""
+        self._attr_native_value = self._compute_native_value()
+
+    def _compute_native_value(self) -> str:
+        """Return the value of the sensor for the current coordinator data."""
         # Update value from coordinator if device status changed
-        device_id = self._device["id"]
-        devices_data = self.coordinator.data.get("devices", {})
-
-        for _station_id, devices in devices_data.items():
-            for device in devices.get("data", {}).get("list", []):
-                if device["id"] == device_id:
-                    # Update dynamic values
-                    if self._sensor_id == "_device_status_text":
-                        return "Online" if device.get("status") == 1 else "Offline"
-                    # For static values, return stored value
-                    break
+        if self._is_status:
+            device = self.coordinator.device_by_id.get(self._device_id)
+            if device is not None:
+                return _STATUS_TEXT.get(device.get("status"), "Offline")
 
+        # For static values, return stored value
         return self._value
 
-    @property
-    def entity_category(self) -> EntityCategory | None:
-        """Return entity category - device info sensors are diagnostic."""
-        return EntityCategory.DIAGNOSTIC
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # Only the status sensor follows the coordinator data
+        if self._is_status:
+            self._attr_native_value = self._compute_native_value()
+        self.async_write_ha_state()
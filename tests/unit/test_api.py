@@ -0,0 +1,531 @@
+"""Tests for the SolarGuardian API client."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from typing import Any
+
+import aiohttp
+import orjson
+import pytest
+
+from custom_components.solarguardian import api as api_module
+from custom_components.solarguardian.api import (
+    SolarGuardianAPI,
+    SolarGuardianAPIError,
+    SolarGuardianRateLimitError,
+    SolarGuardianTransientError,
+    _TokenBucket,
+)
+from custom_components.solarguardian.const import (
+    ENDPOINT_AUTH,
+    MAX_REQUEST_RETRIES,
+    STATUS_TOO_FREQUENT,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class FakeResponse:
+    """Response returned by FakeSession.post."""
+
+    def __init__(
+        self, status: int = 200, body: Any = None, headers: dict | None = None
+    ) -> None:
+        """Initialize."""
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def __aenter__(self) -> FakeResponse:
+        """Enter the request context."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Exit the request context."""
+
+    async def read(self) -> bytes:
+        """Return the encoded body."""
+        return b"" if self._body is None else orjson.dumps(self._body)
+
+    async def text(self) -> str:
+        """Return the body as text."""
+        return (await self.read()).decode()
+
+    async def json(self) -> Any:
+        """Return the decoded body."""
+        return self._body
+
+
+class FakeSession:
+    """Session that answers requests from a list of responses in order."""
+
+    def __init__(self, responses: list[FakeResponse | Exception]) -> None:
+        """Initialize."""
+        self._responses = list(responses)
+        self.requests: list[tuple[str, Any, dict]] = []
+
+    def post(
+        self, url: str, *, json: Any = None, data: Any = None, headers: dict
+    ) -> FakeResponse:
+        """Record the request and return the next response."""
+        self.requests.append((url, json, dict(headers)))
+        response = self._responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    async def close(self) -> None:
+        """Close the session."""
+
+
+def ok(data: Any = None, headers: dict | None = None) -> FakeResponse:
+    """Return a successful API response."""
+    return FakeResponse(200, {"status": 0, "data": data or {}}, headers)
+
+
+def auth_ok(token: str) -> FakeResponse:
+    """Return a successful login response."""
+    return ok({"X-Access-Token": token})
+
+
+def devices_page(count: int, total: int | None = None) -> FakeResponse:
+    """Return a page of the device list."""
+    data: dict[str, Any] = {"list": [{"id": n} for n in range(count)]}
+    if total is not None:
+        data["total"] = total
+    return ok(data)
+
+
+def make_client(
+    responses: list[FakeResponse | Exception],
+    secret: str = "app-secret",
+    token: str | None = "token",
+) -> tuple[SolarGuardianAPI, FakeSession]:
+    """Return a client answering from the given responses."""
+    client = SolarGuardianAPI("api.example.com", "app-key", secret)
+    client._session = session = FakeSession(responses)
+    if token is not None:
+        client._set_token(token, datetime.now() + timedelta(hours=1))
+    return client, session
+
+
+def auth_requests(session: FakeSession) -> list[tuple[str, Any, dict]]:
+    """Return the login requests a session received."""
+    return [
+        request for request in session.requests if request[0].endswith(ENDPOINT_AUTH)
+    ]
+
+
+class FakeClock:
+    """Monotonic clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache() -> Iterator[None]:
+    """Keep tokens from leaking between tests through the shared cache."""
+    api_module._TOKEN_CACHE.clear()
+    yield
+    api_module._TOKEN_CACHE.clear()
+
+
+@pytest.fixture(autouse=True)
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[float]]:
+    """Record the API module's sleeps instead of sleeping."""
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(api_module.asyncio, "sleep", fake_sleep)
+    yield delays
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Drive the token buckets with a fake clock."""
+    fake_clock = FakeClock()
+    monkeypatch.setattr(api_module, "monotonic", fake_clock)
+    return fake_clock
+
+
+class TestTokenBucket:
+    """Tests for _TokenBucket."""
+
+    async def test_burst_passes_without_waiting(
+        self, clock: FakeClock, sleeps: list[float]
+    ) -> None:
+        """A full bucket lets a burst through immediately."""
+        bucket = _TokenBucket(30, 5)
+        assert [await bucket.acquire() for _ in range(5)] == [0.0] * 5
+        assert sleeps == []
+
+    async def test_waits_for_refill_when_empty(
+        self, clock: FakeClock, sleeps: list[float]
+    ) -> None:
+        """Once empty, a caller waits for the next token to accrue."""
+        bucket = _TokenBucket(30, 5)
+        for _ in range(5):
+            await bucket.acquire()
+
+        # 25 tokens per minute are refilled, one every 2.4 seconds
+        assert await bucket.acquire() == pytest.approx(2.4)
+        assert sleeps == [pytest.approx(2.4)]
+
+    @pytest.mark.parametrize(("calls_per_minute", "burst"), [(5, 5), (5, 10), (5, 0)])
+    def test_rejects_limits_without_refill(
+        self, calls_per_minute: int, burst: int
+    ) -> None:
+        """A bucket that could never refill or never pass a call is refused."""
+        with pytest.raises(ValueError, match="burst"):
+            _TokenBucket(calls_per_minute, burst)
+
+    async def test_concurrent_callers_wait_in_arrival_order(
+        self, clock: FakeClock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Waiting callers reserve consecutive tokens without blocking each other."""
+        bucket = _TokenBucket(30, 5)
+        for _ in range(5):
+            await bucket.acquire()
+
+        release = asyncio.Event()
+        delays: list[float] = []
+
+        async def blocking_sleep(delay: float) -> None:
+            delays.append(delay)
+            await release.wait()
+
+        monkeypatch.setattr(api_module.asyncio, "sleep", blocking_sleep)
+        waiters = [asyncio.create_task(bucket.acquire()) for _ in range(2)]
+        await asyncio.wait(waiters, timeout=0.1)
+
+        # Both callers are asleep at the same time, the second for one more token
+        assert delays == [pytest.approx(2.4), pytest.approx(4.8)]
+        release.set()
+        assert await asyncio.gather(*waiters) == [
+            pytest.approx(2.4),
+            pytest.approx(4.8),
+        ]
+
+    async def test_refill_over_time(
+        self, clock: FakeClock, sleeps: list[float]
+    ) -> None:
+        """Tokens accrue with time, up to the burst size."""
+        bucket = _TokenBucket(30, 5)
+        for _ in range(5):
+            await bucket.acquire()
+
+        clock.now += 2.5
+        assert await bucket.acquire() == 0.0
+
+        clock.now += 3600
+        assert [await bucket.acquire() for _ in range(5)] == [0.0] * 5
+        assert await bucket.acquire() == pytest.approx(2.4)
+
+
+class TestRetries:
+    """Tests for which failures are retried."""
+
+    async def test_rate_limit_rejection_is_retried(self, sleeps: list[float]) -> None:
+        """A "too frequent" rejection is retried after a back-off."""
+        client, session = make_client(
+            [
+                FakeResponse(200, {"status": STATUS_TOO_FREQUENT, "info": "busy"}),
+                ok({"list": []}),
+            ]
+        )
+
+        assert await client.get_power_stations() == {
+            "status": 0,
+            "data": {"list": []},
+        }
+        assert len(session.requests) == 2
+        assert len(sleeps) == 1
+
+    async def test_rate_limit_rejection_raised_after_max_retries(
+        self, sleeps: list[float]
+    ) -> None:
+        """A request rejected on every attempt raises the rate limit error."""
+        client, session = make_client(
+            [FakeResponse(200, {"status": STATUS_TOO_FREQUENT, "info": "busy"})]
+            * (MAX_REQUEST_RETRIES + 1)
+        )
+
+        with pytest.raises(SolarGuardianRateLimitError):
+            await client.get_power_stations()
+        assert len(session.requests) == MAX_REQUEST_RETRIES + 1
+
+    @pytest.mark.parametrize(
+        "failure",
+        [
+            FakeResponse(502),
+            FakeResponse(503),
+            FakeResponse(504),
+            aiohttp.ClientConnectionError("connection reset"),
+            TimeoutError(),
+        ],
+    )
+    async def test_transient_failure_is_retried(
+        self, failure: FakeResponse | Exception, sleeps: list[float]
+    ) -> None:
+        """Gateway errors, network errors and timeouts are retried."""
+        client, session = make_client([failure, ok()])
+
+        assert await client.get_power_stations() == {"status": 0, "data": {}}
+        assert len(session.requests) == 2
+
+    async def test_transient_failure_raised_after_max_retries(
+        self, sleeps: list[float]
+    ) -> None:
+        """A request failing on every attempt raises the transient error."""
+        client, session = make_client([FakeResponse(503)] * (MAX_REQUEST_RETRIES + 1))
+
+        with pytest.raises(SolarGuardianTransientError):
+            await client.get_power_stations()
+        assert len(session.requests) == MAX_REQUEST_RETRIES + 1
+
+    @pytest.mark.parametrize(
+        "failure",
+        [
+            FakeResponse(400),
+            FakeResponse(500),
+            FakeResponse(200, {"status": 1, "info": "invalid parameter"}),
+            aiohttp.ClientPayloadError("truncated"),
+        ],
+    )
+    async def test_other_failures_are_raised_immediately(
+        self, failure: FakeResponse | Exception, sleeps: list[float]
+    ) -> None:
+        """Other HTTP, API and client errors are not retried."""
+        client, session = make_client([failure, ok()])
+
+        with pytest.raises(SolarGuardianAPIError) as err:
+            await client.get_power_stations()
+        assert not isinstance(
+            err.value, SolarGuardianRateLimitError | SolarGuardianTransientError
+        )
+        assert len(session.requests) == 1
+        assert sleeps == []
+
+
+class TestReauthentication:
+    """Tests for re-authenticating when the token is rejected."""
+
+    async def test_cached_token_is_reused(self) -> None:
+        """Requests with an unexpired token do not log in again."""
+        client, session = make_client([ok(), ok()])
+
+        await client.get_power_stations()
+        await client.get_power_stations()
+        assert auth_requests(session) == []
+
+    async def test_rejected_token_reauthenticates_once(self) -> None:
+        """A 401 logs in again and retries the request with the new token."""
+        client, session = make_client(
+            [FakeResponse(401), auth_ok("new-token"), ok({"list": []})],
+            token="old-token",
+        )
+
+        assert await client.get_power_stations() == {
+            "status": 0,
+            "data": {"list": []},
+        }
+        assert len(auth_requests(session)) == 1
+        assert session.requests[0][2]["X-Access-Token"] == "old-token"
+        assert session.requests[2][2]["X-Access-Token"] == "new-token"
+
+    async def test_second_rejection_is_raised(self) -> None:
+        """A request rejected again after logging in is not retried again."""
+        client, session = make_client(
+            [FakeResponse(401), auth_ok("new-token"), FakeResponse(401), ok()]
+        )
+
+        with pytest.raises(SolarGuardianAPIError, match="401"):
+            await client.get_power_stations()
+        assert len(session.requests) == 3
+        assert len(auth_requests(session)) == 1
+
+    async def test_rejected_latest_data_token_reauthenticates_once(self) -> None:
+        """The latest data endpoint also logs in again after a 401."""
+        client, session = make_client(
+            [FakeResponse(401), auth_ok("new-token"), ok({"list": []})],
+            token="old-token",
+        )
+
+        assert await client.get_latest_data_by_datapoints(
+            [{"dataPointId": 1, "deviceNo": "GW1"}]
+        ) == {"status": 0, "data": {"list": []}}
+        assert len(auth_requests(session)) == 1
+        assert session.requests[2][2]["X-Access-Token"] == "new-token"
+
+    async def test_second_latest_data_rejection_is_raised(self) -> None:
+        """Latest data rejected again after logging in is not retried again."""
+        client, session = make_client(
+            [FakeResponse(401), auth_ok("new-token"), FakeResponse(401), ok()]
+        )
+
+        with pytest.raises(SolarGuardianAPIError, match="401"):
+            await client.get_latest_data_by_datapoints(
+                [{"dataPointId": 1, "deviceNo": "GW1"}]
+            )
+        assert len(session.requests) == 3
+        assert len(auth_requests(session)) == 1
+
+    async def test_clients_share_cached_token(self) -> None:
+        """A client with the same credentials reuses another client's token."""
+        client, _ = make_client([auth_ok("token")], token=None)
+        assert await client.authenticate()
+
+        other_client, other_session = make_client([], token=None)
+        assert await other_client.authenticate()
+        assert other_session.requests == []
+
+    async def test_invalidated_token_is_not_shared(self) -> None:
+        """A token rejected by one client is not handed to others."""
+        client, _ = make_client([auth_ok("token")], token=None)
+        await client.authenticate()
+        client.invalidate_token()
+
+        other_client, other_session = make_client([auth_ok("new-token")], token=None)
+        assert await other_client.authenticate()
+        assert len(auth_requests(other_session)) == 1
+
+    async def test_cached_token_requires_matching_secret(self) -> None:
+        """A client with a different secret does not reuse a cached token."""
+        client, _ = make_client([auth_ok("token")], token=None)
+        assert await client.authenticate()
+
+        wrong_client, wrong_session = make_client(
+            [FakeResponse(200, {"status": 1, "info": "invalid app secret"})],
+            secret="wrong-secret",
+            token=None,
+        )
+        with pytest.raises(SolarGuardianAPIError):
+            await wrong_client.authenticate()
+        assert len(auth_requests(wrong_session)) == 1
+
+
+class TestConditionalRequests:
+    """Tests for reusing responses with ETag and Last-Modified."""
+
+    async def test_not_modified_reuses_cached_body(self) -> None:
+        """A 304 answer returns the body cached for the same request."""
+        client, session = make_client(
+            [ok({"list": [{"id": 1}]}, {"ETag": '"v1"'}), FakeResponse(304)]
+        )
+
+        first = await client.get_devices(1)
+        assert await client.get_devices(1) is first
+        assert "If-None-Match" not in session.requests[0][2]
+        assert session.requests[1][2]["If-None-Match"] == '"v1"'
+
+    async def test_last_modified_is_sent_back(self) -> None:
+        """A Last-Modified validator makes the next request conditional."""
+        modified = "Wed, 14 Oct 2026 10:00:00 GMT"
+        client, session = make_client(
+            [ok(headers={"Last-Modified": modified}), FakeResponse(304)]
+        )
+
+        await client.get_devices(1)
+        await client.get_devices(1)
+        assert session.requests[1][2]["If-Modified-Since"] == modified
+
+    async def test_validators_are_kept_per_request(self) -> None:
+        """A validator is only sent for the request it was issued for."""
+        client, session = make_client(
+            [ok(headers={"ETag": '"v1"'}), ok(headers={"ETag": '"v2"'})]
+        )
+
+        await client.get_devices(1)
+        await client.get_devices(2)
+        assert "If-None-Match" not in session.requests[1][2]
+
+    async def test_response_without_validators_is_not_conditional(self) -> None:
+        """Without ETag or Last-Modified the request is repeated in full."""
+        client, session = make_client([ok(), ok()])
+
+        await client.get_devices(1)
+        await client.get_devices(1)
+        assert "If-None-Match" not in session.requests[1][2]
+        assert "If-Modified-Since" not in session.requests[1][2]
+
+    async def test_no_cache_keys_before_validators_are_seen(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Requests are not serialized for the cache until it has entries."""
+        keys: list[str] = []
+
+        def cache_key(endpoint: str, payload: dict) -> str:
+            keys.append(endpoint)
+            return f"{endpoint}:{sorted(payload.items())}"
+
+        monkeypatch.setattr(api_module, "_validator_cache_key", cache_key)
+        client, _ = make_client([ok(), ok(), ok(headers={"ETag": '"v1"'}), ok()])
+
+        await client.get_devices(1)
+        await client.get_devices(2)
+        assert keys == []
+
+        await client.get_devices(3)
+        await client.get_devices(4)
+        assert len(keys) == 2
+
+    async def test_oldest_cached_response_is_evicted(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The cache keeps a bounded number of the most recent responses."""
+        monkeypatch.setattr(api_module, "MAX_VALIDATOR_CACHE_ENTRIES", 2)
+        client, session = make_client(
+            [
+                ok(headers={"ETag": '"v1"'}),
+                ok(headers={"ETag": '"v2"'}),
+                FakeResponse(304),
+                ok(headers={"ETag": '"v3"'}),
+                ok(),
+                FakeResponse(304),
+            ]
+        )
+
+        for station in (1, 2, 1, 3, 2, 1):
+            await client.get_devices(station)
+        assert "If-None-Match" not in session.requests[4][2]
+        assert session.requests[5][2]["If-None-Match"] == '"v1"'
+
+
+class TestDevicePagination:
+    """Tests for iter_devices."""
+
+    @pytest.mark.parametrize(
+        ("pages", "devices"),
+        [
+            # total reported: stop once it is reached
+            ([devices_page(2, 5), devices_page(2, 5), devices_page(1, 5)], 5),
+            ([devices_page(2, 4), devices_page(2, 4)], 4),
+            # no total: stop on a short page, or an empty one after a full page
+            ([devices_page(2), devices_page(1)], 3),
+            ([devices_page(2), devices_page(2), devices_page(0)], 4),
+            # a total that is never reached stops on an empty page
+            ([devices_page(2, 100), devices_page(0, 100)], 2),
+        ],
+    )
+    async def test_stops_after_last_page(
+        self, pages: list[FakeResponse], devices: int
+    ) -> None:
+        """Every device is yielded and no page past the last is requested."""
+        client, session = make_client(pages)
+
+        assert len([device async for device in client.iter_devices(1, 2)]) == devices
+        assert len(session.requests) == len(pages)
+        assert [request[1]["pageNo"] for request in session.requests] == list(
+            range(1, len(pages) + 1)
+        )
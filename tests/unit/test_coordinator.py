@@ -0,0 +1,207 @@
+"""Tests for the SolarGuardian data update coordinator helpers."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Awaitable, Callable
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from custom_components.solarguardian import (
+    SolarGuardianDataUpdateCoordinator,
+    _index_latest_values,
+    _LatestDataState,
+    _scan_device_parameters,
+    device_info,
+)
+from custom_components.solarguardian.api import SolarGuardianAPIError
+from custom_components.solarguardian.const import LATEST_DATA_BATCH_SIZE, MOCK_DEVICE
+
+pytestmark = pytest.mark.unit
+
+
+class TestLatestDataState:
+    """Tests for _LatestDataState."""
+
+    def test_disables_after_consecutive_failures(self) -> None:
+        """Latest data is disabled once, on the last allowed failure."""
+        state = _LatestDataState()
+
+        results = [state.record_failure() for _ in range(state.max_failures + 2)]
+        assert results == [False] * (state.max_failures - 1) + [True, False, False]
+        assert state.disabled
+
+    def test_success_resets_failure_count(self) -> None:
+        """Only failures in a row count towards disabling."""
+        state = _LatestDataState()
+        for _ in range(state.max_failures - 1):
+            state.record_failure()
+
+        state.record_success()
+        assert state.failures == 0
+        assert not state.record_failure()
+        assert not state.disabled
+
+    def test_reenables_after_successful_updates(self) -> None:
+        """A disabled endpoint is tried again after enough good updates."""
+        state = _LatestDataState()
+        for _ in range(state.max_failures):
+            state.record_failure()
+
+        results = [state.record_update() for _ in range(state.reenable_after_updates)]
+        assert results == [False] * (state.reenable_after_updates - 1) + [True]
+        assert not state.disabled
+        assert state.failures == 0
+
+    def test_updates_do_nothing_while_enabled(self) -> None:
+        """Updates are only counted while latest data is disabled."""
+        state = _LatestDataState()
+
+        assert not state.record_update()
+        assert state.updates_since_disable == 0
+
+
+def test_latest_values_are_parsed_once() -> None:
+    """Numeric values become floats, others are kept, the first point wins."""
+    data = {
+        "device_data": {
+            1: {
+                "latest_data": {
+                    "data": {
+                        "list": [
+                            {"dataPointId": 10, "value": "12.50"},
+                            {"dataPointId": 11, "value": "nan"},
+                            {"dataPointId": 12, "value": "n/a"},
+                            {"dataPointId": 10, "value": "99"},
+                        ]
+                    }
+                }
+            },
+            2: {"data": {}},
+        }
+    }
+
+    values = _index_latest_values(data)
+    assert list(values) == [1]
+    assert values[1][10] == 12.5
+    assert math.isnan(values[1][11])
+    assert values[1][12] == "n/a"
+
+
+def test_mock_data_is_fresh_for_every_refresh() -> None:
+    """Changing one cycle's mock data does not leak into the next one."""
+    create_mock_data = SolarGuardianDataUpdateCoordinator._create_mock_data
+    coordinator = SimpleNamespace()
+
+    data = create_mock_data(coordinator)
+    data["device_data"][MOCK_DEVICE["id"]]["latest_data"] = {"data": {"list": []}}
+    for devices in data["devices"].values():
+        devices["data"]["list"][0]["equipmentName"] = "Changed"
+
+    fresh = create_mock_data(coordinator)
+    assert "latest_data" not in fresh["device_data"][MOCK_DEVICE["id"]]
+    assert MOCK_DEVICE["equipmentName"] == "Test Solar Inverter"
+
+
+def test_device_info_is_not_shared_between_entities() -> None:
+    """Each entity gets its own device info, equal for the same device."""
+    device = {"id": 11, "equipmentName": "Inverter", "version": "1.0"}
+
+    first = device_info(device)
+    first["identifiers"].add(("other", "1"))
+    first["name"] = "Changed"
+
+    second = device_info(device)
+    assert second == {
+        "identifiers": {("solarguardian", "11")},
+        "name": "Inverter",
+        "manufacturer": "Epever",
+        "model": "Solar Inverter",
+        "sw_version": "1.0",
+    }
+
+
+def test_parameters_without_datapoints_are_not_covered() -> None:
+    """Readable variables without a datapoint only have parameter values."""
+    variables = [
+        {"dataPointId": 1, "deviceNo": "GW1"},
+        {"dataIdentifier": "Setting", "mode": "1"},
+    ]
+    device_data = {"data": {"variableGroupList": [{"variableList": variables}]}}
+
+    params = _scan_device_parameters(device_data, 0)
+    assert params.datapoints == ({"dataPointId": 1, "deviceNo": "GW1"},)
+    assert params.covered
+
+    variables.append({"dataIdentifier": "NoPoint"})
+    assert not _scan_device_parameters(device_data, 0).covered
+
+
+class FakeLatestDataAPI:
+    """API answering latest data with the values it knows, failing some batches."""
+
+    def __init__(self, values: dict[tuple, str], failing_device_no: str = "") -> None:
+        """Initialize."""
+        self._values = values
+        self._failing_device_no = failing_device_no
+
+    async def get_latest_data_by_datapoints(self, datapoints: list[dict]) -> dict:
+        """Return the known values of the requested datapoints."""
+        if any(point["deviceNo"] == self._failing_device_no for point in datapoints):
+            raise SolarGuardianAPIError("Latest data API request failed: 500")
+        points = [
+            {**point, "value": self._values[key]}
+            for point in datapoints
+            if (key := (point["dataPointId"], point["deviceNo"])) in self._values
+        ]
+        return {"status": 0, "data": {"list": points}}
+
+
+async def update_latest_data(
+    api: FakeLatestDataAPI, datapoint_owners: dict[tuple, Any]
+) -> set:
+    """Run a latest data update for the given datapoints."""
+
+    async def limited(request: Callable[[], Awaitable[Any]]) -> Any:
+        return await request()
+
+    coordinator = SimpleNamespace(api=api, _limited=limited, _latest=_LatestDataState())
+    data = {
+        "device_data": {device_id: {} for device_id in datapoint_owners.values()},
+        "update_summary": {"errors": []},
+    }
+    datapoints = [
+        {"dataPointId": point_id, "deviceNo": device_no}
+        for point_id, device_no in datapoint_owners
+    ]
+    return await SolarGuardianDataUpdateCoordinator._async_update_latest_data(
+        coordinator, data, datapoints, datapoint_owners
+    )
+
+
+class TestLatestDataCompleteness:
+    """Tests for telling which devices got all their latest values."""
+
+    async def test_devices_with_every_value_are_complete(self) -> None:
+        """A device is complete once each of its datapoints was answered."""
+        owners = {(1, "GW1"): 11, (2, "GW1"): 11, (3, "GW2"): 12}
+        api = FakeLatestDataAPI({(1, "GW1"): "1", (2, "GW1"): "2", (3, "GW2"): "3"})
+
+        assert await update_latest_data(api, owners) == {11, 12}
+
+    async def test_device_missing_a_value_is_incomplete(self) -> None:
+        """A device whose datapoint is missing from the response is incomplete."""
+        owners = {(1, "GW1"): 11, (2, "GW1"): 11, (3, "GW2"): 12}
+        api = FakeLatestDataAPI({(1, "GW1"): "1", (3, "GW2"): "3"})
+
+        assert await update_latest_data(api, owners) == {12}
+
+    async def test_failed_batch_leaves_devices_incomplete(self) -> None:
+        """Devices of a failed latest data request are not complete."""
+        owners = {(point_id, "GW1"): 11 for point_id in range(LATEST_DATA_BATCH_SIZE)}
+        owners[(0, "GW2")] = 12
+        api = FakeLatestDataAPI(dict.fromkeys(owners, "1"), failing_device_no="GW2")
+
+        assert await update_latest_data(api, owners) == {11}
@@ -0,0 +1,140 @@
+"""Tests for the SolarGuardian sensors."""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+import pytest
+
+from custom_components.solarguardian.sensor import _build_sensor, _enum_translations
+
+pytestmark = pytest.mark.unit
+
+DEVICE = {"id": 11, "equipmentName": "Inverter"}
+DATA_POINT_ID = 1003
+CHARGE_STATE = {
+    "dataIdentifier": "ChargeState",
+    "variableNameE": "Charge State",
+    "unit": "",
+    "decimal": "0",
+    "dataPointId": DATA_POINT_ID,
+    "deviceNo": "GW11",
+    "translationChild": [
+        {"value": "0", "resultE": "Not Charging"},
+        {"value": "1", "resultE": "Charging"},
+    ],
+}
+
+
+class FakeCoordinator:
+    """Coordinator stand-in holding one device's parsed latest values."""
+
+    last_update_success = True
+
+    def __init__(self, value: Any) -> None:
+        """Initialize with the parsed latest value of the charge state."""
+        self.data = {
+            "devices": {1: {"data": {"list": [DEVICE]}}},
+            "device_data": {DEVICE["id"]: {"data": {"variableGroupList": []}}},
+        }
+        self.latest_values_by_device = {DEVICE["id"]: {DATA_POINT_ID: value}}
+        self.latest_identifiers_by_device = {DEVICE["id"]: frozenset({"ChargeState"})}
+        self.variables_by_device: dict = {}
+
+
+def build_charge_state_sensor(value: Any) -> Any:
+    """Return the charge state sensor for a parsed latest value."""
+    return _build_sensor(FakeCoordinator(value), DEVICE, CHARGE_STATE, {})
+
+
+def test_enum_value_is_translated() -> None:
+    """An integer enum reading is shown as its text."""
+    assert build_charge_state_sensor(1.0).native_value == "Charging"
+
+
+def test_untranslated_enum_value_is_kept() -> None:
+    """A reading without a translation is shown as the number."""
+    assert build_charge_state_sensor(7.0).native_value == 7.0
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_non_finite_enum_value_does_not_break_setup(
+    value: float, caplog: pytest.LogCaptureFixture
+) -> None:
+    """NaN and infinity are shown as read instead of failing the sensor."""
+    native_value = build_charge_state_sensor(value).native_value
+
+    assert native_value is value
+    assert "Failed to convert value for ChargeState" in caplog.text
+
+
+def test_first_integer_translation_of_a_value_wins() -> None:
+    """Readings match integer translation values, the first mapping wins."""
+    variable = {
+        **CHARGE_STATE,
+        "translationChild": [
+            {"value": "1.0", "resultE": "Fraction"},
+            {"value": "1", "resultE": "Charging"},
+            {"value": "1", "resultE": "Duplicate"},
+        ],
+    }
+
+    sensor = _build_sensor(FakeCoordinator(1.0), DEVICE, variable, {})
+    assert sensor.native_value == "Charging"
+
+
+def test_device_without_a_name_still_gets_sensors() -> None:
+    """A device whose name is missing in the API response does not fail setup."""
+    device = {**DEVICE, "equipmentName": None}
+
+    sensor = _build_sensor(FakeCoordinator(1.0), device, CHARGE_STATE, {})
+    assert sensor.name == "None Charge State"
+
+
+@pytest.mark.parametrize(
+    ("names", "expected"),
+    [
+        ({"variableNameE": None, "variableNameC": "电池电压"}, "Inverter 电池电压"),
+        ({"variableNameE": None, "variableNameC": None}, "Inverter UnknownPoint"),
+        ({"variableNameE": ""}, "Inverter UnknownPoint"),
+    ],
+)
+def test_generic_sensor_without_english_name(
+    names: dict[str, Any], expected: str
+) -> None:
+    """A missing variable name falls back to the Chinese name, then the id."""
+    variable = {
+        "dataIdentifier": "UnknownPoint",
+        "unit": None,
+        "dataPointId": DATA_POINT_ID,
+        **names,
+    }
+
+    sensor = _build_sensor(FakeCoordinator(1.0), DEVICE, variable, {})
+    assert sensor.name == expected
+
+
+def test_enum_translations_skip_malformed_entries() -> None:
+    """Only integer values are mapped, and the first mapping of a value wins."""
+    translations = _enum_translations(
+        [
+            {"value": "1", "resultE": "On"},
+            {"value": "1", "resultE": "Duplicate"},
+            {"value": "-1", "result": "故障"},
+            {"value": 2, "resultE": "Two"},
+            {"value": "1.5", "resultE": "Fraction"},
+            {"value": "nan", "resultE": "Not a number"},
+            {"value": None, "resultE": "Missing"},
+            {"resultE": "No value"},
+            "3",
+        ]
+    )
+
+    assert translations == {1: "On", -1: "故障", 2: "Two"}
+
+
+@pytest.mark.parametrize("translation_child", [None, {"value": "1"}, "1"])
+def test_enum_translations_ignore_non_lists(translation_child: Any) -> None:
+    """A translationChild that is not a list has no translations."""
+    assert _enum_translations(translation_child) == {}